@@ -9,6 +9,10 @@ import requests
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 
+# A JSON array of plan steps, fenced as ```json ...``` or bare in the response
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\[.*?\])\s*```', re.DOTALL)
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
 
 class ActionPlan:
     """Represents an AI-generated action plan"""
@@ -97,6 +101,8 @@ class AIActionPlanner:
         self.ai_manager = ai_manager
         self.logger = logger
         self.config_manager = config_manager
+        # Provider shared by all file-modifying steps of the plan being executed
+        self._plan_provider = None
 
     def generate_plan(self, item, custom_instructions: str = "") -> Optional[ActionPlan]:
         """
@@ -317,12 +323,12 @@ IMPORTANT: Return ONLY the JSON array, no other text before or after."""
 
         try:
             # Extract JSON from response (might be wrapped in markdown)
-            json_match = re.search(r'```json\s*(\[.*?\])\s*```', plan_text, re.DOTALL)
+            json_match = _JSON_BLOCK_RE.search(plan_text)
             if json_match:
                 json_text = json_match.group(1)
             else:
                 # Try to find JSON array directly
-                json_match = re.search(r'\[.*\]', plan_text, re.DOTALL)
+                json_match = _JSON_ARRAY_RE.search(plan_text)
                 if json_match:
                     json_text = json_match.group(0)
                 else:
@@ -392,6 +398,7 @@ IMPORTANT: Return ONLY the JSON array, no other text before or after."""
         total_steps = len(plan.steps)
         completed = 0
         failed = 0
+        self._plan_provider = None  # Resolved by the first step that needs it
 
         for i, step in enumerate(plan.steps):
             step_num = step['step_number']
@@ -541,10 +548,12 @@ IMPORTANT: Return ONLY the JSON array, no other text before or after."""
             with open(full_path, 'r', encoding='utf-8') as f:
                 current_content = f.read()
 
-            # Get AI provider to make changes
-            config = self.config_manager.get_config()
-            provider_name = config.get('AI_PROVIDER', 'none').lower()
-            provider = self._get_ai_provider(provider_name, config)
+            # Get AI provider to make changes (once per plan, not per step)
+            provider = self._plan_provider
+            if provider is None:
+                config = self.config_manager.get_config()
+                provider_name = config.get('AI_PROVIDER', 'none').lower()
+                provider = self._plan_provider = self._get_ai_provider(provider_name, config)
 
             if not provider:
                 return {'success': False, 'error': 'AI provider not available'}
@@ -14,6 +14,17 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+# Lower-cased provider name -> the package its SDK needs (besides GitPython)
+_PROVIDER_PACKAGES = {
+    'chatgpt': 'openai',
+    'claude': 'anthropic',
+    'anthropic': 'anthropic',
+    'github-copilot': 'requests',
+    'copilot': 'requests',
+    'github_copilot': 'requests',
+    'ollama': 'requests',
+}
+
 
 class Logger:
     """Simple logger interface"""
@@ -2115,6 +2126,10 @@ Current file content:
 class LocalGitManager:
     """Manages local git operations for making changes before creating PRs"""
 
+    # Where repositories go when LOCAL_REPO_PATH is not set (Downloads is
+    # typically not synced by OneDrive)
+    DEFAULT_REPO_BASE = Path.home() / "Downloads" / "github_repos"
+
     def __init__(self, logger: Logger, github_token: str):
         self.logger = logger
         self.github_token = github_token
@@ -2160,9 +2175,7 @@ class LocalGitManager:
                 return repo_path
 
         # Default: Use Downloads folder (typically not in OneDrive)
-        downloads = Path.home() / "Downloads"
-        repo_path = downloads / "github_repos" / owner / repo
-        return repo_path
+        return self.DEFAULT_REPO_BASE / owner / repo
 
     def clone_or_pull_repo(self, owner: str, repo: str, local_path: Optional[str] = None) -> Optional[Path]:
         """Clone repository if it doesn't exist, or pull latest changes if it does"""
@@ -2718,18 +2731,14 @@ class LocalGitManager:
 
 def create_ai_provider(provider_name: str, api_key: str, logger: Logger, ollama_url: str = None, ollama_model: str = None) -> Optional[AIProvider]:
     """Factory function to create AI provider instances"""
-    if provider_name.lower() == 'claude':
-        return ClaudeProvider(api_key, logger)
-    elif provider_name.lower() in ['chatgpt', 'openai', 'gpt']:
-        return ChatGPTProvider(api_key, logger)
-    elif provider_name.lower() in ['github-copilot', 'copilot', 'github_copilot']:
-        return GitHubCopilotProvider(api_key, logger)
-    elif provider_name.lower() == 'ollama':
-        # For Ollama, api_key is optional (can be empty string)
-        return OllamaProvider(api_key or "", logger, ollama_url, ollama_model)
-    else:
+    provider_class = _PROVIDER_CLASSES.get(provider_name.lower())
+    if provider_class is None:
         logger.log(f"⚠️ Unknown AI provider: {provider_name}")
         return None
+    if provider_class is OllamaProvider:
+        # For Ollama, api_key is optional (can be empty string)
+        return OllamaProvider(api_key or "", logger, ollama_url, ollama_model)
+    return provider_class(api_key, logger)
 
 
 def get_detailed_python_environment_info() -> dict:
@@ -3034,6 +3043,18 @@ Return the complete updated file content now (NO explanatory text):"""
         return response.strip()
 
 
+# Lower-cased provider name -> provider class, for create_ai_provider
+_PROVIDER_CLASSES = {
+    'claude': ClaudeProvider,
+    'chatgpt': ChatGPTProvider,
+    'openai': ChatGPTProvider,
+    'gpt': ChatGPTProvider,
+    'github-copilot': GitHubCopilotProvider,
+    'copilot': GitHubCopilotProvider,
+    'github_copilot': GitHubCopilotProvider,
+    'ollama': OllamaProvider,
+}
+
 # AI Providers availability flag - now always True since they're included
 AI_PROVIDERS_AVAILABLE = True
 
@@ -3072,16 +3093,10 @@ class AIManager:
         required_common = ['GitPython']
 
         # Provider-specific packages
-        if provider_name.lower() == 'chatgpt':
-            required_packages = required_common + ['openai']
-        elif provider_name.lower() in ['claude', 'anthropic']:
-            required_packages = required_common + ['anthropic']
-        elif provider_name.lower() in ['github-copilot', 'copilot', 'github_copilot']:
-            required_packages = required_common + ['requests']
-        elif provider_name.lower() == 'ollama':
-            required_packages = required_common + ['requests']
-        else:
+        provider_package = _PROVIDER_PACKAGES.get(provider_name.lower())
+        if provider_package is None:
             return True, []  # Unknown provider, assume no check needed
+        required_packages = required_common + [provider_package]
 
         for package in required_packages:
             try:
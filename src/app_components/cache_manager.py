@@ -6,11 +6,32 @@ Stores fetched items in temporary cache to avoid reloading on every app start
 import json
 import os
 import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from hashlib import md5
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; the standard library json module is used otherwise
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize cache data to compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse cache file contents written by _dumps (or by older, indented versions)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class CacheManager:
     """Manages caching of GitHub PRs and Issues"""
@@ -37,16 +58,26 @@ class CacheManager:
         return self.cache_dir / f"{cache_key}.json"
 
     def is_cache_valid(self, source_type: str, identifier: str) -> bool:
-        """Check if cache exists and is still valid"""
-        cache_key = self._get_cache_key(source_type, identifier)
-        cache_path = self._get_cache_path(cache_key)
+        """
+        Check if cache exists and is still valid, without loading it
+
+        Uses a single stat() call for both the existence and the age check.
+
+        Args:
+            source_type: 'target_prs', 'fork_issues', etc.
+            identifier: repository identifier or config hash
+
+        Returns:
+            True if a valid cache file exists
+        """
+        cache_path = self._get_cache_path(self._get_cache_key(source_type, identifier))
 
-        if not cache_path.exists():
+        try:
+            mtime = os.stat(cache_path).st_mtime
+        except OSError:
             return False
 
-        # Check if cache has expired
-        file_age = time.time() - cache_path.stat().st_mtime
-        return file_age < self.cache_duration_seconds
+        return time.time() - mtime < self.cache_duration_seconds
 
     def load_from_cache(self, source_type: str, identifier: str) -> Optional[List[Dict[str, Any]]]:
         """
@@ -66,8 +97,8 @@ class CacheManager:
         cache_path = self._get_cache_path(cache_key)
 
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            with open(cache_path, 'rb') as f:
+                cache_data = _loads(f.read())
 
             # Validate cache structure
             if 'timestamp' not in cache_data or 'items' not in cache_data:
@@ -79,7 +110,8 @@ class CacheManager:
             print(f"Error loading cache: {e}")
             return None
 
-    def save_to_cache(self, source_type: str, identifier: str, items: List[Dict[str, Any]]) -> bool:
+    def save_to_cache(self, source_type: str, identifier: str, items: List[Dict[str, Any]],
+                      async_write: bool = False) -> bool:
         """
         Save GitHub items to cache
 
@@ -87,28 +119,46 @@ class CacheManager:
             source_type: 'github_prs', 'github_issues', 'target_prs', 'fork_prs', etc.
             identifier: repository identifier or config hash
             items: List of items to cache (PRs or Issues)
+            async_write: Serialize and write on a background thread instead of
+                blocking the caller
 
         Returns:
-            True if successful, False otherwise
+            True if successful (or, with async_write, if the write was started),
+            False otherwise
         """
         cache_key = self._get_cache_key(source_type, identifier)
         cache_path = self._get_cache_path(cache_key)
 
-        try:
-            cache_data = {
-                'timestamp': time.time(),
-                'source_type': source_type,
-                'identifier': identifier,
-                'items': items
-            }
+        cache_data = {
+            'timestamp': time.time(),
+            'source_type': source_type,
+            'identifier': identifier,
+            'items': items
+        }
+
+        if async_write:
+            threading.Thread(target=self._write_cache_file, args=(cache_path, cache_data),
+                             daemon=True).start()
+            return True
 
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        return self._write_cache_file(cache_path, cache_data)
+
+    def _write_cache_file(self, cache_path: Path, cache_data: Dict[str, Any]) -> bool:
+        """Write cache data to a temp file and atomically move it into place"""
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps(cache_data))
 
+            # Readers never see a half-written cache file
+            os.replace(tmp_path, cache_path)
             return True
 
         except Exception as e:
             print(f"Error saving cache: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             return False
 
     def invalidate_cache(self, source_type: str = None, identifier: str = None):
@@ -6,11 +6,36 @@ Now uses config.json + keyring instead of .env files.
 
 import os
 import json
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from pathlib import Path
 from .settings_manager import SettingsManager
 
 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Whitespace-stripped settings that are read on every action"""
+    github_pat: str
+    target_repo: str
+    forked_repo: str
+    local_repo_path: str
+    ai_provider: str  # Lower-cased; 'none' when unset
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'Config':
+        """Build from a settings dict, stripping each value once"""
+        def clean(key: str) -> str:
+            return str(config.get(key) or '').strip()
+
+        return cls(
+            github_pat=clean('GITHUB_PAT'),
+            target_repo=clean('GITHUB_REPO'),
+            forked_repo=clean('FORKED_REPO'),
+            local_repo_path=clean('LOCAL_REPO_PATH'),
+            ai_provider=clean('AI_PROVIDER').lower() or 'none',
+        )
+
+
 class ConfigManager:
     """
     Manages application configuration using the new SettingsManager.
@@ -21,6 +46,11 @@ class ConfigManager:
 
     def __init__(self):
         """Initialize with SettingsManager backend"""
+        # Token-defaulted copy of config served by get_config(); None when stale
+        self._snapshot = None
+        # (snapshot, Config) pair served by get_settings()
+        self._settings_view = (None, None)
+
         # Initialize the modern settings system
         self._settings = SettingsManager()
 
@@ -58,6 +88,16 @@ class ConfigManager:
         # Show configuration status
         self._print_config_status()
 
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Current settings; assigning a new dict refreshes get_config()'s snapshot"""
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        self._config = value
+        self._snapshot = None
+
     def _apply_token_defaults(self):
         """Auto-default GITHUB_TOKEN to GITHUB_PAT if GITHUB_TOKEN is empty"""
         github_token = self.config.get('GITHUB_TOKEN', '').strip() if self.config.get('GITHUB_TOKEN') else ''
@@ -65,6 +105,7 @@ class ConfigManager:
 
         if not github_token and github_pat:
             self.config['GITHUB_TOKEN'] = github_pat
+            self._snapshot = None
             self._settings.set('GITHUB_TOKEN', github_pat, save=False)
 
     def _print_config_status(self):
@@ -101,7 +142,8 @@ class ConfigManager:
         No restart required - changes apply immediately!
 
         Args:
-            config_values: Settings to save
+            config_values: Settings to save; may hold only the changed keys,
+                which are merged into the stored settings
 
         Returns:
             True if successful
@@ -125,18 +167,36 @@ class ConfigManager:
         Get current configuration with automatic GITHUB_TOKEN defaulting.
 
         Returns:
-            Dictionary of all settings
+            Dictionary of all settings (a copy the caller may modify)
         """
-        config = self.config.copy()
+        # The defaulted snapshot is rebuilt only after the config changes
+        if self._snapshot is None:
+            config = self.config.copy()
 
-        # Auto-default GITHUB_TOKEN to GITHUB_PAT if needed
-        github_token = config.get('GITHUB_TOKEN', '').strip() if config.get('GITHUB_TOKEN') else ''
-        github_pat = config.get('GITHUB_PAT', '').strip() if config.get('GITHUB_PAT') else ''
+            # Auto-default GITHUB_TOKEN to GITHUB_PAT if needed
+            github_token = config.get('GITHUB_TOKEN', '').strip() if config.get('GITHUB_TOKEN') else ''
+            github_pat = config.get('GITHUB_PAT', '').strip() if config.get('GITHUB_PAT') else ''
 
-        if not github_token and github_pat:
-            config['GITHUB_TOKEN'] = github_pat
+            if not github_token and github_pat:
+                config['GITHUB_TOKEN'] = github_pat
+
+            self._snapshot = config
+
+        return self._snapshot.copy()
 
-        return config
+    def get_settings(self) -> Config:
+        """
+        Get the frequently used settings as a frozen, pre-stripped Config.
+
+        The object is shared and rebuilt only after the config changes.
+        """
+        if self._snapshot is None:
+            self.get_config()
+        snapshot, settings = self._settings_view
+        if snapshot is not self._snapshot:
+            settings = Config.from_dict(self._snapshot)
+            self._settings_view = (self._snapshot, settings)
+        return settings
 
     def get_value(self, key: str, default: Any = None) -> Any:
         """
@@ -164,16 +224,20 @@ class ConfigManager:
         """
         return self._settings.get(key, default)
 
-    def set_value(self, key: str, value: Any) -> None:
+    def set_value(self, key: str, value: Any, save: bool = True) -> None:
         """
         Set a specific configuration value.
 
         Args:
             key: Setting key
             value: New value
+            save: Whether to persist immediately
         """
-        self._settings.set(key, value)
+        # Update the in-memory config first, so listeners notified by the
+        # settings manager already read the new value
         self.config[key] = value
+        self._snapshot = None
+        self._settings.set(key, value, save=save)
 
     def register_listener(self, callback):
         """
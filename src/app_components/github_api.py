@@ -6,14 +6,106 @@ Handles GitHub GraphQL operations, PR/Issue creation, and Copilot interactions
 import base64
 import difflib
 import json
+import threading
 import requests
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Tuple, Dict, Any, List
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; the standard library json module is used otherwise
+    orjson = None
+
 # Constants
 GITHUB_GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
 USER_AGENT = "github-automation-tool/1.0"
 
+# Upper bound on GitHub requests in flight across all sessions, to stay clear
+# of the secondary (abuse) rate limits when work runs on several threads
+MAX_CONCURRENT_REQUESTS = 5
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _json(response: requests.Response) -> Any:
+    """Parse a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class _ConditionalSession(requests.Session):
+    """
+    Session that revalidates repeated GET requests with their ETag
+
+    GitHub answers an unchanged resource with 304 Not Modified, which does not
+    count against the rate limit; the stored response is returned instead.
+    Entries are keyed by URL and Authorization header, since ETags are
+    token-scoped.
+    """
+
+    MAX_ETAG_ENTRIES = 256
+
+    def __init__(self):
+        super().__init__()
+        self._etag_responses: "OrderedDict[Tuple[str, Optional[str]], requests.Response]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        if orjson is not None and kwargs.get('json') is not None:
+            # Serialize request bodies with orjson rather than requests' json.dumps
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+            headers = {'Content-Type': 'application/json', **(headers or {})}
+
+        if method.upper() != 'GET':
+            with _request_slots:
+                return super().request(method, url, params=params, headers=headers, **kwargs)
+
+        prepared = requests.models.PreparedRequest()
+        prepared.prepare_url(url, params)
+        key = (prepared.url, (headers or {}).get('Authorization'))
+
+        with self._etag_lock:
+            cached = self._etag_responses.get(key)
+        if cached is not None:
+            headers = {**(headers or {}), 'If-None-Match': cached.headers['ETag']}
+
+        with _request_slots:
+            response = super().request(method, url, params=params, headers=headers, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            with self._etag_lock:
+                if key in self._etag_responses:
+                    self._etag_responses.move_to_end(key)
+            return cached
+
+        if response.status_code == 200 and response.headers.get('ETag'):
+            response.content  # Read the body now so the response can be replayed
+            with self._etag_lock:
+                self._etag_responses[key] = response
+                self._etag_responses.move_to_end(key)
+                while len(self._etag_responses) > self.MAX_ETAG_ENTRIES:
+                    self._etag_responses.popitem(last=False)
+        return response
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session that keeps connections to GitHub alive between calls
+
+    Repeated GETs are sent as conditional requests (see _ConditionalSession).
+    Idempotent requests that hit a rate limit or a transient gateway error
+    are retried with backoff; POSTs are never replayed.
+    """
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504),
+                    raise_on_status=False)
+    session = _ConditionalSession()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+    return session
+
 
 class GitHubGQL:
     """GitHub GraphQL API client for creating issues, PRs, and managing assignments"""
@@ -22,6 +114,7 @@ class GitHubGQL:
         self.token = token
         self.logger = logger
         self.dry_run = dry_run
+        self._session = create_session()
     
     def log(self, message: str) -> None:
         """Log a message"""
@@ -49,11 +142,11 @@ class GitHubGQL:
             return {"dryRun": True, "data": None}
 
         try:
-            resp = requests.post(GITHUB_GRAPHQL_ENDPOINT, headers=self._headers(), json=payload, timeout=60)
+            resp = self._session.post(GITHUB_GRAPHQL_ENDPOINT, headers=self._headers(), json=payload, timeout=60)
             if resp.status_code != 200:
                 raise RuntimeError(f"GraphQL HTTP {resp.status_code}: {resp.text}")
             
-            data = resp.json()
+            data = _json(resp)
             if "errors" in data and data["errors"]:
                 raise RuntimeError(f"GraphQL errors: {json.dumps(data['errors'], indent=2)}")
             
@@ -73,10 +166,10 @@ class GitHubGQL:
             self.log(f"[DRY-RUN] Would make {method} request to: {url}")
             return {"number": 123, "html_url": "https://github.com/example/repo/pull/123"}
         
-        response = requests.request(method, url, headers=headers, json=data, timeout=30)
+        response = self._session.request(method, url, headers=headers, json=data, timeout=30)
         response.raise_for_status()
         
-        return response.json()
+        return _json(response)
     
     def get_repo_id(self, owner: str, name: str) -> str:
         """Get GitHub repository ID"""
@@ -403,7 +496,7 @@ class GitHubGQL:
             # 1. Get the current file content from the branch
             self.log(f"Fetching file: {file_path}")
             file_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}?ref={branch_name}"
-            resp = requests.get(file_url, headers=rest_headers, timeout=30)
+            resp = self._session.get(file_url, headers=rest_headers, timeout=30)
 
             if resp.status_code == 404:
                 self.log(f"❌ File not found: {file_path}")
@@ -411,7 +504,7 @@ class GitHubGQL:
                 return False
 
             resp.raise_for_status()
-            file_data = resp.json()
+            file_data = _json(resp)
 
             # Decode the file content
             current_content = base64.b64decode(file_data["content"]).decode('utf-8')
@@ -476,7 +569,7 @@ class GitHubGQL:
             }
 
             update_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
-            resp = requests.put(update_url, headers=rest_headers, json=update_payload, timeout=30)
+            resp = self._session.put(update_url, headers=rest_headers, json=update_payload, timeout=30)
             resp.raise_for_status()
 
             self.log(f"✅ Changes committed to branch {branch_name}")
@@ -759,7 +852,7 @@ Thank you!
             comments_url = f"https://api.github.com/repos/{owner}/{repo}/issues/{pr_number}/comments"
             comment_data = {"body": comment_body}
 
-            resp = requests.post(comments_url, headers=rest_headers, json=comment_data, timeout=30)
+            resp = self._session.post(comments_url, headers=rest_headers, json=comment_data, timeout=30)
 
             if resp.status_code == 403:
                 self.log("❌ Permission denied when adding comment")
@@ -800,23 +893,23 @@ Thank you!
 
             # First, get the latest commit SHA from the PR
             pr_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}"
-            resp = requests.get(pr_url, headers=rest_headers, timeout=30)
+            resp = self._session.get(pr_url, headers=rest_headers, timeout=30)
             resp.raise_for_status()
-            pr_data = resp.json()
+            pr_data = _json(resp)
             commit_sha = pr_data["head"]["sha"]
 
             self.log(f"Latest commit SHA: {commit_sha}")
 
             # Get the file content to find line numbers
             file_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}?ref={commit_sha}"
-            resp = requests.get(file_url, headers=rest_headers, timeout=30)
+            resp = self._session.get(file_url, headers=rest_headers, timeout=30)
 
             if resp.status_code == 404:
                 self.log(f"⚠️ File not found in PR: {file_path}")
                 return False
 
             resp.raise_for_status()
-            file_data = resp.json()
+            file_data = _json(resp)
 
             content = base64.b64decode(file_data["content"]).decode('utf-8')
             lines = content.split('\n')
@@ -859,7 +952,7 @@ Click "Commit suggestion" above to apply this change directly to the PR."""
                 del comment_data["start_line"]
 
             comments_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/comments"
-            resp = requests.post(comments_url, headers=rest_headers, json=comment_data, timeout=30)
+            resp = self._session.post(comments_url, headers=rest_headers, json=comment_data, timeout=30)
 
             if resp.status_code == 403:
                 self.log("❌ Permission denied when adding suggestion")
@@ -902,9 +995,9 @@ Click "Commit suggestion" above to apply this change directly to the PR."""
             # 1. Get the SHA of the main branch
             self.log(f"Getting SHA of main branch...")
             ref_url = f"https://api.github.com/repos/{owner}/{repo}/git/refs/heads/main"
-            resp = requests.get(ref_url, headers=rest_headers, timeout=30)
+            resp = self._session.get(ref_url, headers=rest_headers, timeout=30)
             resp.raise_for_status()
-            main_sha = resp.json()["object"]["sha"]
+            main_sha = _json(resp)["object"]["sha"]
             self.log(f"Main branch SHA: {main_sha}")
 
             # 2. Create new branch from main
@@ -914,7 +1007,7 @@ Click "Commit suggestion" above to apply this change directly to the PR."""
                 "ref": f"refs/heads/{branch_name}",
                 "sha": main_sha
             }
-            resp = requests.post(create_ref_url, headers=rest_headers, json=create_ref_payload, timeout=30)
+            resp = self._session.post(create_ref_url, headers=rest_headers, json=create_ref_payload, timeout=30)
 
             # Check for permission errors
             if resp.status_code == 403:
@@ -932,7 +1025,7 @@ Click "Commit suggestion" above to apply this change directly to the PR."""
 
             # Branch might already exist, that's okay
             if resp.status_code == 422:
-                error_detail = resp.json()
+                error_detail = _json(resp)
                 if "already exists" in str(error_detail).lower():
                     self.log(f"Branch {branch_name} already exists, using existing branch")
                     return True
@@ -965,7 +1058,7 @@ Once you've made the changes, you can delete this file.
             }
 
             file_url = f"https://api.github.com/repos/{owner}/{repo}/contents/.copilot-instructions.md"
-            resp = requests.put(file_url, headers=rest_headers, json=file_payload, timeout=30)
+            resp = self._session.put(file_url, headers=rest_headers, json=file_payload, timeout=30)
             resp.raise_for_status()
 
             self.log(f"✅ Placeholder commit created in branch {branch_name}")
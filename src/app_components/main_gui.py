@@ -8,15 +8,180 @@ import flet as ft
 ft.icons = ft.Icons
 ft.colors = ft.Colors
 import os
+import json
+import logging
+import mmap
 import threading
+import time
+import traceback
+import datetime
 import webbrowser
 import asyncio
-from typing import List, Dict, Any, Optional
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
 from pathlib import Path
 
-from .utils import Logger
+import requests
+
+from .utils import Logger, LocalRepositoryScanner
 from .settings_dialog import SettingsDialog
 from .processing_log_dialog import ProcessingLogDialog
+from .workflow import WorkflowManager, WorkflowItem, GitHubRepoFetcher, format_item_label
+from .cache_manager import CacheManager
+from .ai_action_planner import AIActionPlanner
+from .github_api import create_session
+
+_log = logging.getLogger(__name__)
+
+
+# Shared style objects, built once at import instead of per control
+_MONO_FONT = "Courier New"
+_OUTLINE_BORDER = ft.border.all(1, ft.colors.OUTLINE)
+_BADGE_PADDING = ft.padding.symmetric(horizontal=8, vertical=4)
+
+# Badge (label, colour) by item type and by repo source; anything else is
+# shown as an issue from the fork
+_ITEM_TYPE_BADGES = {"pull_request": ("PR", ft.colors.GREEN)}
+_ISSUE_BADGE = ("Issue", ft.colors.ORANGE)
+_REPO_SOURCE_BADGES = {"target": ("Target", ft.colors.BLUE)}
+_FORK_BADGE = ("Fork", ft.colors.PURPLE)
+
+# All Items (repo_filter, type_filter) -> the workflow_items lists it shows
+_ITEM_FILTER_KEYS = {
+    (repo_filter, type_filter): tuple(f"{source}_{kind}" for source in sources for kind in kinds)
+    for repo_filter, sources in (("both", ("target", "fork")), ("target", ("target",)), ("fork", ("fork",)))
+    for type_filter, kinds in (("both", ("prs", "issues")), ("prs", ("prs",)), ("issues", ("issues",)))
+}
+
+# Closing instructions of the AI analysis prompts
+_PR_ANALYSIS_INSTRUCTIONS = (
+    "\n\nPlease provide a comprehensive summary of this pull request, including:\n"
+    "1. What changes were made\n"
+    "2. The purpose and impact of these changes\n"
+    "3. Any notable patterns or concerns from the comments\n"
+    "4. Overall assessment of the PR"
+)
+_ISSUE_ANALYSIS_INSTRUCTIONS = (
+    "\n\nPlease analyze this issue and provide:\n"
+    "1. A summary of the issue\n"
+    "2. Suggested files or components that might be causing this issue\n"
+    "3. Recommended approach to fix the issue\n"
+    "4. Any additional considerations\n"
+    "\nFor the suggested files, please list them in a clear format like:\n"
+    "SUGGESTED_FILES: file1.py, file2.js, file3.tsx"
+)
+
+# Repeat clicks on the same "Open in GitHub" link within this many seconds
+# are ignored
+_URL_REOPEN_INTERVAL = 1.5
+
+
+# Diff line classes; MainGUI._DIFF_STYLES maps them to display styles
+_TAG_ADD, _TAG_REMOVE, _TAG_CTX, _TAG_HDR, _TAG_FILE, _TAG_HUNK = (
+    'diff_add', 'diff_remove', 'diff_context', 'diff_header', 'diff_file', 'diff_hunk'
+)
+
+
+# First character -> (longer prefix, its tag, tag otherwise); lines starting
+# with any other character are context. Measured faster than one precompiled
+# alternation regex with a tag per group, on typical and on mixed diffs
+_DIFF_LINE_PREFIXES = {
+    '+': ('+++', _TAG_FILE, _TAG_ADD),
+    '-': ('---', _TAG_FILE, _TAG_REMOVE),
+    '@': ('@@', _TAG_HUNK, _TAG_CTX),
+    'd': ('diff ', _TAG_HDR, _TAG_CTX),
+    'i': ('index ', _TAG_HDR, _TAG_CTX),
+}
+
+
+def _classify_diff_line(line: str) -> str:
+    """Return the diff tag for a single line (one table lookup, at most one prefix test)"""
+    entry = _DIFF_LINE_PREFIXES.get(line[:1])
+    if entry is None:
+        return _TAG_CTX
+    prefix, tag, default = entry
+    return tag if line.startswith(prefix) else default
+
+
+def _group_diff_lines(lines: Iterable[Union[str, bytes]]) -> Tuple[Tuple[Tuple[str, str], ...], int]:
+    """
+    Clean diff lines and group them into runs of same-tag lines in a single pass
+
+    AI preamble lines and duplicated '+++' headers are dropped while each
+    kept line is classified, so every line is inspected only once. Raw
+    bytes lines are decoded one at a time instead of as one big string,
+    and a trailing '\r' (CRLF line ends) is dropped from each line.
+
+    Returns:
+        Tuple of ((tag, text) runs in order, number of '+++' file headers)
+    """
+    runs = []
+    run_tag = None
+    run_lines = []
+    plus_plus_count = 0
+    last_header = None
+
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        if line[-1:] == '\r':
+            line = line[:-1]
+        if line[:6] == 'title:':
+            continue
+        if line[:3] == '+++':
+            if line == last_header:
+                continue
+            last_header = line
+            plus_plus_count += 1
+            # Already known to be a file header; no need to classify again
+            tag = _TAG_FILE
+        else:
+            tag = _classify_diff_line(line)
+
+        if tag != run_tag and run_lines:
+            runs.append((run_tag, ''.join(run_lines)))
+            run_lines = []
+        run_tag = tag
+        run_lines.append(line + '\n')
+
+    # The last line has no trailing newline (and an empty last line adds nothing)
+    last_run = ''.join(run_lines)[:-1]
+    if last_run:
+        runs.append((run_tag, last_run))
+
+    return tuple(runs), plus_plus_count
+
+
+@lru_cache(maxsize=8)
+def _diff_runs(diff_content: Union[str, bytes]) -> Tuple[Tuple[Tuple[str, str], ...], int]:
+    """
+    Cleaned, tagged runs of a diff (see _group_diff_lines)
+
+    Cached on the content itself (str/bytes cache their own hash), so
+    re-displaying the same diff does no work. Lines are split on '\n' only,
+    as in _mapped_diff_runs; splitlines() would also break on form feeds
+    and Unicode separators inside a line.
+    """
+    lines = diff_content.split('\n' if isinstance(diff_content, str) else b'\n')
+    if not lines[-1]:
+        lines.pop()
+    return _group_diff_lines(lines)
+
+
+def _mapped_diff_runs(file_path: str) -> Tuple[Tuple[Tuple[str, str], ...], int]:
+    """
+    Cleaned, tagged runs of a large .diff file, read through a memory map
+
+    Lines are pulled from the map one at a time, so the file is never
+    copied into a single bytes object. Not memoized: holding several
+    large decoded diffs for the session would defeat the point.
+    """
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # readline splits on b'\n' only, the same line ends _diff_runs uses
+        return _group_diff_lines(line[:-1] if line[-1:] == b'\n' else line
+                                 for line in iter(mm.readline, b''))
 
 
 class DryRunVar:
@@ -35,6 +200,37 @@ class DryRunVar:
 class MainGUI:
     """Main GUI interface for the application"""
 
+    # Cards rendered per page in the All Items list
+    ALL_ITEMS_PAGE_SIZE = 100
+
+    # Delay used to coalesce rapid workflow item filter requests
+    FILTER_DEBOUNCE_SECONDS = 0.1
+    # Quiet period after the last keystroke before a search is applied
+    SEARCH_DEBOUNCE_SECONDS = 0.3
+    # Page updates requested within this window are sent as one
+    UPDATE_COALESCE_SECONDS = 0.05
+    # Quiet period after the last repo selection before it is saved
+    CONFIG_SAVE_DEBOUNCE_SECONDS = 0.25
+
+    # Maximum rows rendered at once in the .diff file picker
+    DIFF_LIST_RENDER_LIMIT = 500
+    # .diff files above this size are memory-mapped rather than read as text
+    DIFF_MMAP_THRESHOLD = 1_000_000
+    # Persisted .diff file index, reused across sessions
+    DIFF_INDEX_PATH = Path.home() / '.github_pulse' / 'diff_index.json'
+    # Directories never searched for .diff files (as well as any dot-directory)
+    DIFF_SCAN_SKIP_DIRS = frozenset({'node_modules', '__pycache__'})
+
+    # Display style per diff line class (built once, shared by every render)
+    _DIFF_STYLES = {
+        _TAG_ADD: ft.TextStyle(color=ft.Colors.GREEN_400),
+        _TAG_REMOVE: ft.TextStyle(color=ft.Colors.RED_400),
+        _TAG_CTX: None,
+        _TAG_HDR: ft.TextStyle(color=ft.Colors.GREY_500),
+        _TAG_FILE: ft.TextStyle(color=ft.Colors.BLUE_300, weight=ft.FontWeight.BOLD),
+        _TAG_HUNK: ft.TextStyle(color=ft.Colors.PURPLE_200),
+    }
+
     def __init__(self, page: ft.Page, config_manager, ai_manager, app):
         self.page = page
         self.config_manager = config_manager
@@ -47,8 +243,19 @@ class MainGUI:
         self.current_organization = None
         self.edit_mode = False
         self.workflow_items = {}
+        self.workflow_items_total = 0  # Cached item count, refreshed when items are collected
         self.current_workflow_items = []
         self.active_workflow_item = None  # Currently selected item from All Items list
+        self._filter_generation = 0  # Bumped per filter request to debounce bursts
+        self._display_generation = 0  # Bumped per item selection; stale fetches are dropped
+        self._debounce_generations = {}  # Pending debounced actions, keyed by name
+        self._update_pending = False  # A coalesced page update is scheduled
+        self._layout = None  # Root container, built once by build()
+        self._pending_config = {}  # Repo selections not yet saved (see _on_repo_selection_changed)
+        self._diff_index = None  # In-memory copy of the persisted .diff index, loaded on first scan
+        self._diff_scan_running = False  # Set while a .diff scan runs; repeat clicks are ignored
+        self._shown_diff = (None, None)  # (diff Text control, _diff_runs result) currently rendered
+        self._shown_assignees = (None, None, None)  # (item, icon, text) of the rendered assignees row
 
         # Repository data
         self.target_repos = []
@@ -66,8 +273,8 @@ class MainGUI:
         self.text_to_change_ref = ft.Ref[ft.TextField]()
         self.proposed_new_text_ref = ft.Ref[ft.TextField]()
         self.custom_instructions_ref = ft.Ref[ft.TextField]()
-        self.diff_text_ref = ft.Ref[ft.TextField]()
-        self.log_text_ref = ft.Ref[ft.TextField]()
+        self.diff_text_ref = ft.Ref[ft.Text]()
+        self.log_text_ref = ft.Ref[ft.Text]()
         self.edit_button_ref = ft.Ref[ft.IconButton]()
         self.go_button_ref = ft.Ref[ft.ElevatedButton]()
 
@@ -76,17 +283,21 @@ class MainGUI:
         self.repo_source_ref = ft.Ref[ft.RadioGroup]()
         self.item_type_ref = ft.Ref[ft.RadioGroup]()
         self.create_type_ref = ft.Ref[ft.RadioGroup]()
-        self.target_repo_dropdown_ref = ft.Ref[ft.Dropdown]()
-        self.forked_repo_dropdown_ref = ft.Ref[ft.Dropdown]()
         self.workflow_item_dropdown_ref = ft.Ref[ft.Dropdown]()
         self.active_item_display_ref = ft.Ref[ft.Container]()
-        self.item_counter_ref = ft.Ref[ft.Text]()
+
+        # Controls read by the repo/item handlers on every event are held
+        # directly instead of through Refs; None until the sidebar is built
+        self.target_repo_dropdown: Optional[ft.Dropdown] = None
+        self.forked_repo_dropdown: Optional[ft.Dropdown] = None
+        self.item_counter: Optional[ft.Text] = None
 
         # DataTable ref for all items
         self.items_table_ref = ft.Ref[ft.DataTable]()
 
         # All items display
-        self.all_items_container_ref = ft.Ref[ft.Column]()
+        self.all_items_container_ref = ft.Ref[ft.ListView]()
+        self._all_items_view = []  # Full filtered/sorted model behind the All Items list
         self.all_items_search_ref = ft.Ref[ft.TextField]()
         self.all_items_type_filter_ref = ft.Ref[ft.RadioGroup]()
         self.all_items_repo_filter_ref = ft.Ref[ft.RadioGroup]()
@@ -97,8 +308,13 @@ class MainGUI:
         self.sidebar_ref = ft.Ref[ft.Container]()
         self.tools_content_ref = ft.Ref[ft.Column]()
 
+        self._workflow_manager = None  # Built by _get_workflow_manager
+        self._snackbar = None  # Reused by _show_snackbar
+        self._authenticated_login = (None, None)  # (token, login) from _get_authenticated_login
+        self._last_open = (None, 0.0)  # (url, monotonic time) from _open_url
+        self._github_session = create_session()  # Pooled connection for direct REST calls
+
         # Initialize cache manager
-        from .cache_manager import CacheManager
         self.cache_manager = CacheManager(cache_duration_hours=24)
 
         # Initialize logger
@@ -117,7 +333,15 @@ class MainGUI:
         self.config_manager.register_listener(self._on_settings_changed)
 
     def build(self) -> ft.Container:
-        """Build and return the main UI with VS Code-style layout"""
+        """
+        Build and return the main UI with VS Code-style layout
+
+        The layout is built once; later calls (e.g. re-mounting) return the
+        same control tree, whose Refs and attributes stay valid.
+        """
+        if self._layout is not None:
+            return self._layout
+
         # Top navigation bar with branding and buttons
         top_nav = ft.Container(
             content=ft.Row(
@@ -187,12 +411,11 @@ class MainGUI:
             vertical_alignment=ft.CrossAxisAlignment.STRETCH,
         )
 
-        # Create hidden log text field for the processing log dialog
-        hidden_log_text = ft.TextField(
+        # Hidden log buffer for the processing log dialog; a plain Text since
+        # it is only ever written programmatically, never edited
+        hidden_log_text = ft.Text(
             ref=self.log_text_ref,
-            multiline=True,
-            read_only=True,
-            text_style=ft.TextStyle(font_family="Courier New"),
+            font_family=_MONO_FONT,
             visible=False,  # Hidden from main UI
         )
 
@@ -215,10 +438,11 @@ class MainGUI:
         # Start async initialization
         self.page.run_task(self._async_init)
 
-        return ft.Container(
+        self._layout = ft.Container(
             content=app_layout,
             expand=True,
         )
+        return self._layout
 
     async def _async_init(self):
         """Async initialization"""
@@ -238,7 +462,7 @@ class MainGUI:
             else:
                 self.sidebar_ref.current.width = 0
                 self.sidebar_ref.current.visible = False
-            self.page.update()
+            self._schedule_update()
 
     def _create_title_section(self) -> ft.Container:
         """Create the title section with buttons"""
@@ -271,16 +495,16 @@ class MainGUI:
         )
 
         # Target Repository
+        self.target_repo_dropdown = ft.Dropdown(
+            label="Target Repository",
+            hint_text="Select target repository",
+            options=[],
+            expand=True,
+            on_change=self._on_repo_selection_changed,
+        )
         target_repo_row = ft.Row(
             [
-                ft.Dropdown(
-                    ref=self.target_repo_dropdown_ref,
-                    label="Target Repository",
-                    hint_text="Select target repository",
-                    options=[],
-                    expand=True,
-                    on_change=self._on_repo_selection_changed,
-                ),
+                self.target_repo_dropdown,
                 ft.IconButton(
                     icon=ft.icons.REFRESH,
                     tooltip="Refresh",
@@ -296,16 +520,16 @@ class MainGUI:
         )
 
         # Forked Repository
+        self.forked_repo_dropdown = ft.Dropdown(
+            label="Forked Repository",
+            hint_text="Select forked repository",
+            options=[],
+            expand=True,
+            on_change=self._on_repo_selection_changed,
+        )
         forked_repo_row = ft.Row(
             [
-                ft.Dropdown(
-                    ref=self.forked_repo_dropdown_ref,
-                    label="Forked Repository",
-                    hint_text="Select forked repository",
-                    options=[],
-                    expand=True,
-                    on_change=self._on_repo_selection_changed,
-                ),
+                self.forked_repo_dropdown,
                 ft.IconButton(
                     icon=ft.icons.REFRESH,
                     tooltip="Refresh",
@@ -321,6 +545,7 @@ class MainGUI:
         )
 
         # Action controls (for action mode)
+        self.item_counter = ft.Text(value="No items loaded")
         action_controls = ft.Column(
             [
                 ft.Text("Active Item", weight=ft.FontWeight.BOLD, size=14),
@@ -334,7 +559,7 @@ class MainGUI:
                             text_align=ft.TextAlign.CENTER,
                         ),
                         padding=10,
-                        border=ft.border.all(1, ft.colors.OUTLINE),
+                        border=_OUTLINE_BORDER,
                         border_radius=8,
                         bgcolor=ft.colors.GREY_900,
                         expand=True,
@@ -347,7 +572,7 @@ class MainGUI:
                         "📥 Pull PRs/Issues",
                         on_click=lambda e: self.page.run_task(self._load_workflow_items_async),
                     ),
-                    ft.Text(ref=self.item_counter_ref, value="No items loaded"),
+                    self.item_counter,
                 ]),
                 ft.TextField(
                     ref=self.all_items_search_ref,
@@ -355,6 +580,8 @@ class MainGUI:
                     prefix_icon=ft.icons.SEARCH,
                     dense=True,
                     on_change=self._on_all_items_search_changed,
+                    on_submit=self._on_all_items_search_flush,
+                    on_blur=self._on_all_items_search_flush,
                     border_radius=8,
                 ),
                 ft.Text("Source Repo", weight=ft.FontWeight.BOLD),
@@ -380,17 +607,16 @@ class MainGUI:
                     on_change=self._on_all_items_filter_changed,
                 ),
                 ft.Container(
-                    content=ft.Column(
+                    # ListView only lays out the rows scrolled into view
+                    content=ft.ListView(
                         ref=self.all_items_container_ref,
                         controls=[
                             ft.Text("No items loaded", color=ft.colors.GREY_500, italic=True, text_align=ft.TextAlign.CENTER)
                         ],
                         spacing=10,
-                        scroll=ft.ScrollMode.AUTO,
-                        horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
                     ),
                     height=300,
-                    border=ft.border.all(1, ft.colors.OUTLINE),
+                    border=_OUTLINE_BORDER,
                     border_radius=8,
                     padding=5,
                 ),
@@ -452,6 +678,13 @@ class MainGUI:
 
     def _create_tabs_section(self) -> ft.Container:
         """Create the tabbed interface"""
+        # Only the first tab is built up front; the others are built the
+        # first time they are selected (see _on_tab_changed)
+        self._tab_builders = {
+            1: self._create_diff_tab,
+            2: self._create_ai_plan_tab,
+        }
+
         tabs = ft.Tabs(
             selected_index=0,
             animation_duration=300,
@@ -464,14 +697,15 @@ class MainGUI:
                 ft.Tab(
                     text="View Diff",
                     icon=ft.icons.DIFFERENCE,
-                    content=self._create_diff_tab()
+                    content=ft.Container(expand=True)
                 ),
                 ft.Tab(
                     text="AI Action Plan",
                     icon=ft.icons.AUTO_AWESOME,
-                    content=self._create_ai_plan_tab()
+                    content=ft.Container(expand=True)
                 ),
             ],
+            on_change=self._on_tab_changed,
             expand=True,
         )
 
@@ -480,6 +714,14 @@ class MainGUI:
             expand=True,
         )
 
+    def _on_tab_changed(self, e):
+        """Build a tab's content the first time it is selected"""
+        index = e.control.selected_index
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            e.control.tabs[index].content = builder()
+            e.control.update()
+
     def _create_current_item_tab(self) -> ft.Container:
         """Create the current item tab"""
         # Create a container to hold the dynamic content
@@ -505,12 +747,10 @@ class MainGUI:
                         ),
                     ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
                     alignment=ft.alignment.center,
-                    expand=True,
                 ),
             ],
             ref=self.current_item_content_ref,
             spacing=15,
-            scroll=ft.ScrollMode.AUTO,
         )
 
         return ft.Container(
@@ -540,12 +780,23 @@ class MainGUI:
             spacing=10,
         )
 
-        diff_text = ft.TextField(
-            ref=self.diff_text_ref,
-            multiline=True,
-            read_only=True,
+        diff_text = ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text(
+                        ref=self.diff_text_ref,
+                        selectable=True,
+                        font_family=_MONO_FONT,
+                        size=13,
+                    ),
+                ],
+                scroll=ft.ScrollMode.AUTO,
+                expand=True,
+            ),
+            border=_OUTLINE_BORDER,
+            border_radius=5,
+            padding=10,
             expand=True,
-            text_style=ft.TextStyle(font_family="Courier New"),
         )
 
         return ft.Container(
@@ -571,7 +822,7 @@ class MainGUI:
                 ft.DataColumn(ft.Text("Status")),
             ],
             rows=[],
-            border=ft.border.all(1, ft.colors.OUTLINE),
+            border=_OUTLINE_BORDER,
             border_radius=8,
             heading_row_color=ft.colors.BLUE_GREY_100,
         )
@@ -606,15 +857,15 @@ class MainGUI:
         """
         # Update repository dropdowns when repos change in settings
         if key == 'GITHUB_REPO':
-            if self.target_repo_dropdown_ref.current:
-                self.target_repo_dropdown_ref.current.value = value
-                self.page.update()
+            if self.target_repo_dropdown:
+                self.target_repo_dropdown.value = value
+                self._schedule_update()
                 print(f"✓ Main GUI: Target repo updated to {value}")
 
         elif key == 'FORKED_REPO':
-            if self.forked_repo_dropdown_ref.current:
-                self.forked_repo_dropdown_ref.current.value = value
-                self.page.update()
+            if self.forked_repo_dropdown:
+                self.forked_repo_dropdown.value = value
+                self._schedule_update()
                 print(f"✓ Main GUI: Forked repo updated to {value}")
 
     def _on_mode_changed(self, e):
@@ -623,36 +874,58 @@ class MainGUI:
         # Implementation depends on UI structure
         pass
 
-    def _on_repo_selection_changed(self, e):
-        """Handle repository selection change"""
-        # Save selected repos to settings
-        config = self.config_manager.get_config()
-
-        if self.target_repo_dropdown_ref.current and self.target_repo_dropdown_ref.current.value:
-            target_value = self.target_repo_dropdown_ref.current.value
-            # Don't save separator headers
-            if not target_value.startswith('---'):
-                config['GITHUB_REPO'] = target_value
+    def _repo_for_item(self, item) -> str:
+        """Return the configured "owner/repo" an item was loaded from (target or fork)"""
+        config_key = 'GITHUB_REPO' if item.repo_source == "target" else 'FORKED_REPO'
+        return self.config_manager.get_config().get(config_key, '')
 
-        if self.forked_repo_dropdown_ref.current and self.forked_repo_dropdown_ref.current.value:
-            forked_value = self.forked_repo_dropdown_ref.current.value
-            # Don't save separator headers
-            if not forked_value.startswith('---'):
-                config['FORKED_REPO'] = forked_value
+    def _clean_repo_choice(self, dropdown: Optional[ft.Dropdown]) -> str:
+        """Return the dropdown's "owner/repo" value, or '' for empty or separator header choices"""
+        value = (dropdown.value or '').strip() if dropdown else ''
+        return '' if value[:3] == '---' or '/' not in value else value
 
-        # Save to config
-        self.config_manager.save_configuration(config)
+    def _on_repo_selection_changed(self, e):
+        """Handle repository selection change"""
+        # Save selected repos to settings; only the changed keys are passed,
+        # as saving merges them into the stored settings
+        changes = {}
+
+        # Don't save separator headers
+        target_value = self._clean_repo_choice(self.target_repo_dropdown)
+        if target_value:
+            changes['GITHUB_REPO'] = target_value
+
+        forked_value = self._clean_repo_choice(self.forked_repo_dropdown)
+        if forked_value:
+            changes['FORKED_REPO'] = forked_value
+
+        # Apply to the in-memory config right away, so items loaded for the new
+        # repos resolve against them; the disk write waits for selections to settle
+        for key, value in changes.items():
+            self.config_manager.set_value(key, value, save=False)
+        if changes:
+            self._pending_config.update(changes)
+            self._debounce('save_repo_selection', self.CONFIG_SAVE_DEBOUNCE_SECONDS,
+                           self.flush_pending_config)
 
         # Clear workflow items when repos change
         self.workflow_items = {}
+        self.workflow_items_total = 0
         self.current_workflow_items = []
         if self.workflow_item_dropdown_ref.current:
             self.workflow_item_dropdown_ref.current.options = []
-            self.page.update()
+            self._schedule_update()
 
         # Auto-load cached items for the newly selected repos
         self.page.run_task(self._auto_load_cached_items_on_repo_change)
 
+    def flush_pending_config(self):
+        """Save the repo selections gathered by _on_repo_selection_changed"""
+        self._cancel_debounce('save_repo_selection')
+        changes, self._pending_config = self._pending_config, {}
+        if changes:
+            self.config_manager.save_configuration(changes)
+
     def _on_workflow_item_selected(self, e):
         """Handle workflow item selection"""
         if not self.workflow_item_dropdown_ref.current:
@@ -667,14 +940,58 @@ class MainGUI:
                     break
 
     def _on_all_items_search_changed(self, e):
-        """Handle search field change in All Items list"""
+        """Handle search field change in All Items list (debounced per keystroke)"""
         if not self.all_items_search_ref.current:
             return
 
-        search_query = self.all_items_search_ref.current.value or ""
-        type_filter = self.all_items_type_filter_ref.current.value if self.all_items_type_filter_ref.current else "both"
-        repo_filter = self.all_items_repo_filter_ref.current.value if self.all_items_repo_filter_ref.current else "both"
-        self._populate_all_items(search_query, type_filter, repo_filter)
+        self._debounce('all_items_search', self.SEARCH_DEBOUNCE_SECONDS, self._on_all_items_filter_changed, e)
+
+    def _on_all_items_search_flush(self, e):
+        """Apply a pending search immediately on Enter or focus loss"""
+        if self._cancel_debounce('all_items_search'):
+            self._on_all_items_filter_changed(e)
+
+    def _debounce(self, key: str, delay: float, fn, *args):
+        """
+        Run fn(*args) after delay seconds, unless another call with the same key arrives first
+
+        Args:
+            key: Identifies the debounced action; a newer call supersedes older ones
+            delay: Quiet period in seconds
+            fn: Callable to run once input settles
+        """
+        generation = self._debounce_generations.get(key, 0) + 1
+        self._debounce_generations[key] = generation
+
+        async def run_later():
+            await asyncio.sleep(delay)
+            if self._debounce_generations.get(key) == generation:
+                self._debounce_generations.pop(key, None)
+                fn(*args)
+
+        self.page.run_task(run_later)
+
+    def _schedule_update(self):
+        """
+        Request a page update, sharing it with others made within UPDATE_COALESCE_SECONDS
+
+        Handlers that change several controls in quick succession then cost
+        one render instead of one each.
+        """
+        if self._update_pending:
+            return
+        self._update_pending = True
+
+        async def flush():
+            await asyncio.sleep(self.UPDATE_COALESCE_SECONDS)
+            self._update_pending = False
+            self.page.update()
+
+        self.page.run_task(flush)
+
+    def _cancel_debounce(self, key: str) -> bool:
+        """Cancel a pending debounced action, returning True if one was pending"""
+        return self._debounce_generations.pop(key, None) is not None
 
     def _on_all_items_filter_changed(self, e):
         """Handle filter change in All Items list (type or repo source)"""
@@ -684,63 +1001,85 @@ class MainGUI:
         self._populate_all_items(search_query, type_filter, repo_filter)
 
     def _filter_workflow_items(self):
-        """Collect all workflow items (no filtering since toggles were removed)"""
-        print("=" * 60)
-        print("COLLECTING WORKFLOW ITEMS")
-        print("=" * 60)
+        """Schedule a debounced collection of workflow items"""
+        self.page.run_task(self._filter_workflow_items_async)
+
+    def _do_filter_workflow_items(self):
+        """
+        Collect all workflow items (no filtering since toggles were removed)
 
+        Only the item counter changes on screen; callers push it with
+        _updating(self.item_counter).
+        """
         # Collect all items from all categories since filter toggles are removed
         all_items = []
         for key, items in self.workflow_items.items():
             all_items.extend(items)
 
         self.current_workflow_items = all_items
-        print(f"DEBUG: Collected {len(all_items)} total items")
-        print(f"DEBUG: Available keys in workflow_items: {list(self.workflow_items.keys())}")
+        self.workflow_items_total = len(all_items)
+        # Formatted only when debug logging is enabled
+        _log.debug("Collected %d workflow items from %s", self.workflow_items_total, list(self.workflow_items))
 
         if self.logger:
-            self.logger.log(f"Collected {len(all_items)} workflow items from all categories")
+            self.logger.log(f"Collected {self.workflow_items_total} workflow items from all categories")
             self.logger.log(f"Available workflow item keys: {list(self.workflow_items.keys())}")
 
         # Update item counter if it exists
-        if self.item_counter_ref.current:
-            count_text = f"{len(all_items)} item(s) loaded"
-            self.item_counter_ref.current.value = count_text
-            print(f"DEBUG: Counter text set to: {count_text}")
-
-        print("DEBUG: Calling page.update()...")
-        self.page.update()
-        print("DEBUG: page.update() completed")
+        if self.item_counter:
+            count_text = f"{self.workflow_items_total} item(s) loaded"
+            self.item_counter.value = count_text
 
     def _display_workflow_item(self, item):
         """Display a workflow item in the Current Item tab"""
         if not self.current_item_content_ref.current:
             return
 
-        # Get repo string based on source
-        config = self.config_manager.get_config()
-        if item.repo_source == "target":
-            repo_str = config.get('GITHUB_REPO', '')
-        else:
-            repo_str = config.get('FORKED_REPO', '')
+        # Comments and PR files are fetched off the UI thread
+        self._display_generation += 1
+        self.page.run_task(self._display_workflow_item_async, item, self._display_generation)
 
-        # Fetch comments
+    async def _display_workflow_item_async(self, item, generation: int):
+        """Fetch an item's comments (and PR files) in a worker thread, then render it"""
+        repo_str = self._repo_for_item(item)
+
+        # Fetch comments, and the changed files of a pull request, concurrently
         comments = []
         pr_files = []
+        self._show_progress()
         try:
             workflow_manager = self._get_workflow_manager()
-            comments = workflow_manager.fetch_comments(repo_str, item.number, item.item_type == "pull_request")
-
-            # Fetch PR files if this is a pull request
-            if item.item_type == "pull_request":
-                pr_files = workflow_manager.fetch_pr_files(repo_str, item.number)
+            is_pull_request = item.item_type == "pull_request"
+            fetches = [asyncio.to_thread(workflow_manager.fetch_comments, repo_str, item.number, is_pull_request)]
+            if is_pull_request:
+                fetches.append(asyncio.to_thread(workflow_manager.fetch_pr_files, repo_str, item.number))
+
+            results = await asyncio.gather(*fetches)
+            comments = results[0]
+            if is_pull_request:
+                pr_files = results[1]
         except Exception as e:
             print(f"Error fetching item details: {e}")
             if self.logger:
                 self.logger.log(f"Error fetching item details: {e}")
+        finally:
+            self._hide_progress()
+
+        # A newer selection was made while this one was fetching
+        if generation != self._display_generation:
+            return
+
+        self._render_workflow_item(item, repo_str, comments, pr_files)
+
+    def _render_workflow_item(self, item, repo_str: str, comments: List[Dict[str, Any]],
+                              pr_files: List[Dict[str, Any]]):
+        """Build the Current Item tab's controls for an item and its fetched details"""
+        if not self.current_item_content_ref.current:
+            return
 
         # Build the display
         controls = []
+        type_label, type_color = _ITEM_TYPE_BADGES.get(item.item_type, _ISSUE_BADGE)
 
         # Header section
         header = ft.Container(
@@ -748,13 +1087,13 @@ class MainGUI:
                 ft.Row([
                     ft.Container(
                         content=ft.Text(
-                            "PR" if item.item_type == "pull_request" else "Issue",
+                            type_label,
                             size=12,
                             weight=ft.FontWeight.BOLD,
                             color=ft.colors.WHITE,
                         ),
-                        bgcolor=ft.colors.GREEN if item.item_type == "pull_request" else ft.colors.ORANGE,
-                        padding=ft.padding.symmetric(horizontal=8, vertical=4),
+                        bgcolor=type_color,
+                        padding=_BADGE_PADDING,
                         border_radius=4,
                     ),
                     ft.Text(f"#{item.number}", size=18, weight=ft.FontWeight.BOLD),
@@ -762,7 +1101,7 @@ class MainGUI:
                     ft.IconButton(
                         icon=ft.icons.OPEN_IN_BROWSER,
                         tooltip="Open in GitHub",
-                        on_click=lambda e: self.page.launch_url(item.url),
+                        on_click=lambda e: self._open_url(item.url),
                     ),
                 ], alignment=ft.MainAxisAlignment.START),
                 ft.Text(item.title, size=20, weight=ft.FontWeight.BOLD),
@@ -798,35 +1137,24 @@ class MainGUI:
         ]
 
         # Add assignees with assign-to-self button
-        if item.assignees:
-            assignees_text = ", ".join([f"@{a}" for a in item.assignees])
-            info_items.append(
-                ft.Row([
-                    ft.Icon(ft.icons.ASSIGNMENT_IND, size=16, color=ft.colors.BLUE_400),
-                    ft.Text("Assigned to:", weight=ft.FontWeight.BOLD, size=14),
-                    ft.Text(assignees_text, size=14, color=ft.colors.BLUE_300),
-                    ft.IconButton(
-                        icon=ft.icons.PERSON_ADD,
-                        icon_size=16,
-                        tooltip="Assign to me",
-                        on_click=lambda _: self._assign_to_self(item, repo_str),
-                    ),
-                ], spacing=5)
-            )
-        else:
-            info_items.append(
-                ft.Row([
-                    ft.Icon(ft.icons.ASSIGNMENT_IND, size=16, color=ft.colors.GREY_600),
-                    ft.Text("Assigned to:", weight=ft.FontWeight.BOLD, size=14),
-                    ft.Text("Unassigned", size=14, color=ft.colors.GREY_500, italic=True),
-                    ft.IconButton(
-                        icon=ft.icons.PERSON_ADD,
-                        icon_size=16,
-                        tooltip="Assign to me",
-                        on_click=lambda _: self._assign_to_self(item, repo_str),
-                    ),
-                ], spacing=5)
-            )
+        assignees_icon = ft.Icon(ft.icons.ASSIGNMENT_IND, size=16)
+        assignees_text = ft.Text(size=14)
+        self._set_assignees_display(assignees_icon, assignees_text, item.assignees)
+        # Kept so a successful "Assign to me" can update just this row
+        self._shown_assignees = (item, assignees_icon, assignees_text)
+        info_items.append(
+            ft.Row([
+                assignees_icon,
+                ft.Text("Assigned to:", weight=ft.FontWeight.BOLD, size=14),
+                assignees_text,
+                ft.IconButton(
+                    icon=ft.icons.PERSON_ADD,
+                    icon_size=16,
+                    tooltip="Assign to me",
+                    on_click=lambda _: self._assign_to_self(item, repo_str),
+                ),
+            ], spacing=5)
+        )
 
         # PR-specific info
         if item.item_type == "pull_request":
@@ -843,7 +1171,7 @@ class MainGUI:
         info_section = ft.Container(
             content=ft.Column(info_items, spacing=8),
             padding=15,
-            border=ft.border.all(1, ft.colors.OUTLINE),
+            border=_OUTLINE_BORDER,
             border_radius=8,
         )
         controls.append(info_section)
@@ -864,7 +1192,7 @@ class MainGUI:
                             ),
                         ], spacing=5),
                         padding=10,
-                        border=ft.border.all(1, ft.colors.OUTLINE),
+                        border=_OUTLINE_BORDER,
                         border_radius=4,
                         bgcolor=ft.colors.GREY_900,
                     ),
@@ -875,7 +1203,7 @@ class MainGUI:
         controls.append(
             ft.Container(
                 content=description_section,
-                border=ft.border.all(1, ft.colors.OUTLINE),
+                border=_OUTLINE_BORDER,
                 border_radius=8,
             )
         )
@@ -907,7 +1235,7 @@ class MainGUI:
                                    color=ft.colors.GREY_400),
                         ], spacing=8),
                         padding=8,
-                        border=ft.border.all(1, ft.colors.OUTLINE),
+                        border=_OUTLINE_BORDER,
                         border_radius=4,
                         bgcolor=ft.colors.GREY_900,
                     )
@@ -924,52 +1252,33 @@ class MainGUI:
                     ),
                 ], spacing=8),
                 padding=15,
-                border=ft.border.all(1, ft.colors.OUTLINE),
+                border=_OUTLINE_BORDER,
                 border_radius=8,
             )
             controls.append(files_section)
 
-        # Comments section (collapsible, collapsed by default)
-        comments_widgets = []
-        if comments:
-            for comment in comments:
-                comments_widgets.append(
-                    ft.Container(
-                        content=ft.Column([
-                            ft.Row([
-                                ft.Icon(ft.icons.PERSON, size=14),
-                                ft.Text(f"@{comment['user']}", weight=ft.FontWeight.BOLD, size=13),
-                                ft.Text(
-                                    comment['created_at'][:10] if comment.get('created_at') else '',
-                                    size=11,
-                                    color=ft.colors.GREY_600
-                                ),
-                            ], spacing=5),
-                            ft.Text(comment['body'], size=13, selectable=True),
-                        ], spacing=5),
-                        padding=10,
-                        border=ft.border.all(1, ft.colors.OUTLINE),
-                        border_radius=4,
-                        bgcolor=ft.colors.GREY_900,
-                    )
-                )
-        else:
-            comments_widgets.append(
-                ft.Text("No comments yet", italic=True, color=ft.colors.GREY_500, size=13)
-            )
+        # Comments section (collapsible, collapsed by default); the comment
+        # cards are only built the first time it is expanded
+        comments_column = ft.Column(
+            controls=[],
+            spacing=8,
+            scroll=ft.ScrollMode.AUTO,
+            height=min(250, max(100, len(comments) * 80)),
+        )
+
+        def on_comments_expanded(e):
+            if e.data == "true" and not comments_column.controls:
+                comments_column.controls = self._build_comment_widgets(comments)
+                comments_column.update()
 
         comments_section = ft.ExpansionTile(
             title=ft.Text(f"Comments ({len(comments)})", size=16, weight=ft.FontWeight.BOLD),
             subtitle=ft.Text("Click to expand", size=12, color=ft.colors.GREY_500),
             initially_expanded=False,
+            on_change=on_comments_expanded,
             controls=[
                 ft.Container(
-                    content=ft.Column(
-                        controls=comments_widgets,
-                        spacing=8,
-                        scroll=ft.ScrollMode.AUTO,
-                        height=min(250, max(100, len(comments) * 80)),
-                    ),
+                    content=comments_column,
                     margin=ft.margin.only(left=10, right=10, bottom=10),
                 ),
             ],
@@ -977,7 +1286,7 @@ class MainGUI:
         controls.append(
             ft.Container(
                 content=comments_section,
-                border=ft.border.all(1, ft.colors.OUTLINE),
+                border=_OUTLINE_BORDER,
                 border_radius=8,
             )
         )
@@ -988,15 +1297,54 @@ class MainGUI:
         controls.append(ai_section)
 
         # Update the content
-        self.current_item_content_ref.current.controls = controls
-        self.page.update()
+        with self._updating(self.current_item_content_ref.current):
+            self.current_item_content_ref.current.controls = controls
+
+    def _set_assignees_display(self, icon: ft.Icon, text: ft.Text, assignees: List[str]):
+        """Show an item's assignees (or "Unassigned") in its assignees row"""
+        if assignees:
+            icon.color = ft.colors.BLUE_400
+            text.value = ", ".join([f"@{a}" for a in assignees])
+            text.color = ft.colors.BLUE_300
+            text.italic = False
+        else:
+            icon.color = ft.colors.GREY_600
+            text.value = "Unassigned"
+            text.color = ft.colors.GREY_500
+            text.italic = True
+
+    def _build_comment_widgets(self, comments: List[Dict[str, Any]]) -> List[ft.Control]:
+        """Build the comment cards for the Current Item tab's comments section"""
+        if not comments:
+            return [ft.Text("No comments yet", italic=True, color=ft.colors.GREY_500, size=13)]
+
+        return [
+            ft.Container(
+                content=ft.Column([
+                    ft.Row([
+                        ft.Icon(ft.icons.PERSON, size=14),
+                        ft.Text(f"@{comment['user']}", weight=ft.FontWeight.BOLD, size=13),
+                        ft.Text(
+                            comment['created_at'][:10] if comment.get('created_at') else '',
+                            size=11,
+                            color=ft.colors.GREY_600
+                        ),
+                    ], spacing=5),
+                    ft.Text(comment['body'], size=13, selectable=True),
+                ], spacing=5),
+                padding=10,
+                border=_OUTLINE_BORDER,
+                border_radius=4,
+                bgcolor=ft.colors.GREY_900,
+            )
+            for comment in comments
+        ]
 
     def _create_ai_analysis_section(self, item, repo_str, pr_files, comments):
         """Create the AI Analysis section"""
         # Check if AI provider is configured
-        config = self.config_manager.get_config()
-        ai_provider = config.get('AI_PROVIDER', 'none').lower()
-        ai_configured = ai_provider and ai_provider != 'none'
+        ai_provider = self.config_manager.get_settings().ai_provider
+        ai_configured = ai_provider != 'none'
 
         # Create result container
         ai_result_container = ft.Column(
@@ -1053,7 +1401,7 @@ class MainGUI:
                 ai_result_container,
             ], spacing=10),
             padding=15,
-            border=ft.border.all(1, ft.colors.OUTLINE),
+            border=_OUTLINE_BORDER,
             border_radius=8,
         )
 
@@ -1079,7 +1427,7 @@ class MainGUI:
         def run_analysis():
             try:
                 config = self.config_manager.get_config()
-                ai_provider = config.get('AI_PROVIDER', 'none').lower()
+                ai_provider = self.config_manager.get_settings().ai_provider
 
                 if item.item_type == "pull_request":
                     # PR Analysis: Summarize changes
@@ -1173,8 +1521,9 @@ class MainGUI:
     def _analyze_pr(self, item, repo_str, pr_files, comments, ai_provider, config):
         """Analyze a Pull Request using AI"""
         try:
-            # Build context for AI
-            context = f"""Pull Request Analysis Request
+            # Build context for AI; parts are joined once at the end, so long
+            # file lists are not re-copied on every append
+            parts = [f"""Pull Request Analysis Request
 
 Repository: {repo_str}
 PR Number: #{item.number}
@@ -1186,20 +1535,20 @@ Description:
 {item.body if item.body else 'No description provided'}
 
 Modified Files ({len(pr_files)}):
-"""
-            for file in pr_files:
-                context += f"\n- {file['filename']} ({file['status']}) [+{file['additions']} -{file['deletions']}]"
+"""]
+            parts.extend(
+                f"\n- {file['filename']} ({file['status']}) [+{file['additions']} -{file['deletions']}]"
+                for file in pr_files
+            )
 
             if comments:
-                context += f"\n\nComments ({len(comments)}):\n"
-                for comment in comments[:5]:  # Limit to first 5 comments
-                    context += f"\n@{comment['user']}: {comment['body'][:200]}...\n"
+                parts.append(f"\n\nComments ({len(comments)}):\n")
+                parts.extend(  # Limit to first 5 comments
+                    f"\n@{comment['user']}: {comment['body'][:200]}...\n" for comment in comments[:5]
+                )
 
-            context += "\n\nPlease provide a comprehensive summary of this pull request, including:\n"
-            context += "1. What changes were made\n"
-            context += "2. The purpose and impact of these changes\n"
-            context += "3. Any notable patterns or concerns from the comments\n"
-            context += "4. Overall assessment of the PR"
+            parts.append(_PR_ANALYSIS_INSTRUCTIONS)
+            context = "".join(parts)
 
             # Call AI manager
             summary = self.ai_manager.generate_response(context, ai_provider, config)
@@ -1224,7 +1573,7 @@ Modified Files ({len(pr_files)}):
         """Analyze an Issue using AI to suggest fixes"""
         try:
             # Build context for AI
-            context = f"""GitHub Issue Analysis Request
+            parts = [f"""GitHub Issue Analysis Request
 
 Repository: {repo_str}
 Issue Number: #{item.number}
@@ -1233,20 +1582,16 @@ State: {item.state}
 
 Description:
 {item.body if item.body else 'No description provided'}
-"""
+"""]
 
             if comments:
-                context += f"\n\nComments ({len(comments)}):\n"
-                for comment in comments[:5]:  # Limit to first 5 comments
-                    context += f"\n@{comment['user']}: {comment['body'][:200]}...\n"
-
-            context += "\n\nPlease analyze this issue and provide:\n"
-            context += "1. A summary of the issue\n"
-            context += "2. Suggested files or components that might be causing this issue\n"
-            context += "3. Recommended approach to fix the issue\n"
-            context += "4. Any additional considerations\n"
-            context += "\nFor the suggested files, please list them in a clear format like:\n"
-            context += "SUGGESTED_FILES: file1.py, file2.js, file3.tsx"
+                parts.append(f"\n\nComments ({len(comments)}):\n")
+                parts.extend(  # Limit to first 5 comments
+                    f"\n@{comment['user']}: {comment['body'][:200]}...\n" for comment in comments[:5]
+                )
+
+            parts.append(_ISSUE_ANALYSIS_INSTRUCTIONS)
+            context = "".join(parts)
 
             # Call AI manager
             analysis = self.ai_manager.generate_response(context, ai_provider, config)
@@ -1282,6 +1627,16 @@ Description:
         if self.logger:
             self.logger.log(f"PR creation requested for Issue #{item.number}")
 
+    def _get_authenticated_login(self, github_token: str, headers: Dict[str, str]) -> Optional[str]:
+        """Return the token owner's login, looked up once per token"""
+        cached_token, login = self._authenticated_login
+        if cached_token != github_token or not login:
+            response = self._github_session.get("https://api.github.com/user", headers=headers, timeout=10)
+            response.raise_for_status()
+            login = response.json().get('login')
+            self._authenticated_login = (github_token, login)
+        return login
+
     def _assign_to_self(self, item, repo_str):
         """Assign the current PR or Issue to the authenticated user"""
         try:
@@ -1301,7 +1656,6 @@ Description:
             owner, repo = repo_str.split('/', 1)
 
             # Get authenticated user
-            import requests
             headers = {
                 "Authorization": f"Bearer {github_token}",
                 "Accept": "application/vnd.github+json",
@@ -1309,9 +1663,7 @@ Description:
             }
 
             # First, get the authenticated user's username
-            user_response = requests.get("https://api.github.com/user", headers=headers, timeout=10)
-            user_response.raise_for_status()
-            username = user_response.json().get('login')
+            username = self._get_authenticated_login(github_token, headers)
 
             if not username:
                 self._show_snackbar("Could not get authenticated user", error=True)
@@ -1326,15 +1678,19 @@ Description:
                 "assignees": [username]
             }
 
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = self._github_session.post(url, headers=headers, json=payload, timeout=10)
             response.raise_for_status()
 
             # Update the item in memory
             if username not in item.assignees:
                 item.assignees.append(username)
 
-            # Refresh the display
-            self._display_workflow_item(item)
+            # Only the assignees row changed, so update it in place instead of
+            # re-fetching and re-rendering the whole item
+            shown_item, assignees_icon, assignees_text = self._shown_assignees
+            if shown_item is item:
+                with self._updating(assignees_icon, assignees_text):
+                    self._set_assignees_display(assignees_icon, assignees_text, item.assignees)
 
             self._show_snackbar(f"Successfully assigned to @{username}", error=False)
 
@@ -1342,6 +1698,9 @@ Description:
                 self.logger.log(f"Assigned {item.item_type} #{item.number} to @{username}")
 
         except requests.exceptions.RequestException as e:
+            # A rejected token must not keep serving a cached login
+            if e.response is not None and e.response.status_code == 401:
+                self._authenticated_login = (None, None)
             error_msg = f"Error assigning to self: {str(e)}"
             self._show_snackbar(error_msg, error=True)
             if self.logger:
@@ -1363,24 +1722,11 @@ Description:
         if not self.all_items_container_ref.current:
             return
 
-        # Collect all items from workflow_items
+        # workflow_items is already split by repo source and type, so the
+        # filters select whole lists with one lookup instead of testing each item
         all_items = []
-        for key, items in self.workflow_items.items():
-            all_items.extend(items)
-
-        # Apply repo source filter
-        if repo_filter == "target":
-            all_items = [item for item in all_items if item.repo_source == "target"]
-        elif repo_filter == "fork":
-            all_items = [item for item in all_items if item.repo_source == "fork"]
-        # "both" shows everything, no filtering needed
-
-        # Apply type filter
-        if type_filter == "prs":
-            all_items = [item for item in all_items if item.item_type == "pull_request"]
-        elif type_filter == "issues":
-            all_items = [item for item in all_items if item.item_type == "issue"]
-        # "both" shows everything, no filtering needed
+        for key in _ITEM_FILTER_KEYS.get((repo_filter, type_filter), _ITEM_FILTER_KEYS["both", "both"]):
+            all_items.extend(self.workflow_items.get(key, ()))
 
         # Apply search filter if provided
         if search_query:
@@ -1396,6 +1742,8 @@ Description:
                     filtered_items.append(item)
             all_items = filtered_items
 
+        self._all_items_view = all_items
+
         if not all_items:
             if search_query or type_filter != "both" or repo_filter != "both":
                 filter_desc = []
@@ -1422,24 +1770,44 @@ Description:
             # Sort by updated_at (most recent first)
             all_items.sort(key=lambda x: x.updated_at if hasattr(x, 'updated_at') else '', reverse=True)
 
-            # Create item cards
-            cards = []
-            for item in all_items:
-                cards.append(self._create_item_card(item))
-
-            self.all_items_container_ref.current.controls = cards
+            # Build the first page of cards, then swap them in with a single assignment
+            self.all_items_container_ref.current.controls = self._build_item_cards_page(0)
+
+        # One targeted update of the list instead of diffing the whole page
+        if self.all_items_container_ref.current.page:
+            self.all_items_container_ref.current.update()
+
+    def _build_item_cards_page(self, start: int) -> List[ft.Control]:
+        """Build cards for one page of the All Items model, plus a "show more" row if needed"""
+        end = start + self.ALL_ITEMS_PAGE_SIZE
+        cards = [self._create_item_card(item) for item in self._all_items_view[start:end]]
+
+        remaining = len(self._all_items_view) - end
+        if remaining > 0:
+            cards.append(ft.TextButton(
+                f"Show {min(remaining, self.ALL_ITEMS_PAGE_SIZE)} more ({remaining} remaining)",
+                icon=ft.icons.EXPAND_MORE,
+                on_click=lambda e: self._show_more_items(end),
+            ))
+        return cards
+
+    def _show_more_items(self, start: int):
+        """Append the next page of cards to the All Items list"""
+        container = self.all_items_container_ref.current
+        if not container:
+            return
 
-        self.page.update()
+        with self._updating(container):
+            # Drop the "show more" button and append the next page in its place
+            container.controls = container.controls[:-1] + self._build_item_cards_page(start)
 
     def _create_item_card(self, item):
         """Create a card for a workflow item"""
         # Determine repo source label
-        repo_label = "Target" if item.repo_source == "target" else "Fork"
-        repo_color = ft.colors.BLUE if item.repo_source == "target" else ft.colors.PURPLE
+        repo_label, repo_color = _REPO_SOURCE_BADGES.get(item.repo_source, _FORK_BADGE)
 
         # Determine type label
-        type_label = "PR" if item.item_type == "pull_request" else "Issue"
-        type_color = ft.colors.GREEN if item.item_type == "pull_request" else ft.colors.ORANGE
+        type_label, type_color = _ITEM_TYPE_BADGES.get(item.item_type, _ISSUE_BADGE)
 
         # Create card
         return ft.Container(
@@ -1449,19 +1817,19 @@ Description:
                     ft.Container(
                         content=ft.Text(repo_label, size=10, weight=ft.FontWeight.BOLD),
                         bgcolor=repo_color,
-                        padding=ft.padding.symmetric(horizontal=8, vertical=4),
+                        padding=_BADGE_PADDING,
                         border_radius=4,
                     ),
                     # Type badge
                     ft.Container(
                         content=ft.Text(type_label, size=10, weight=ft.FontWeight.BOLD),
                         bgcolor=type_color,
-                        padding=ft.padding.symmetric(horizontal=8, vertical=4),
+                        padding=_BADGE_PADDING,
                         border_radius=4,
                     ),
                     # Title
                     ft.Text(
-                        f"#{item.number}: {item.title}",
+                        format_item_label(item),
                         size=12,
                         expand=True,
                         overflow=ft.TextOverflow.ELLIPSIS,
@@ -1485,7 +1853,7 @@ Description:
                 alignment=ft.MainAxisAlignment.START,
             ),
             padding=8,
-            border=ft.border.all(1, ft.colors.OUTLINE),
+            border=_OUTLINE_BORDER,
             border_radius=4,
             bgcolor=ft.colors.GREY_800,
         )
@@ -1542,7 +1910,8 @@ Description:
 
             self.items_table_ref.current.rows = rows
 
-        self.page.update()
+        if self.items_table_ref.current.page:
+            self.items_table_ref.current.update()
 
     def _select_item_as_current(self, item):
         """Select an item as the current active workflow item"""
@@ -1557,10 +1926,8 @@ Description:
             self.generate_plan_button_ref.current.disabled = False
 
         # Determine display labels
-        repo_label = "Target" if item.repo_source == "target" else "Fork"
-        repo_color = ft.colors.BLUE if item.repo_source == "target" else ft.colors.PURPLE
-        type_label = "PR" if item.item_type == "pull_request" else "Issue"
-        type_color = ft.colors.GREEN if item.item_type == "pull_request" else ft.colors.ORANGE
+        repo_label, repo_color = _REPO_SOURCE_BADGES.get(item.repo_source, _FORK_BADGE)
+        type_label, type_color = _ITEM_TYPE_BADGES.get(item.item_type, _ISSUE_BADGE)
 
         # Update the active item display with a nice card
         self.active_item_display_ref.current.content = ft.Column([
@@ -1589,7 +1956,7 @@ Description:
                 ),
             ], spacing=5),
             ft.Text(
-                f"#{item.number}: {item.title}",
+                format_item_label(item),
                 size=12,
                 weight=ft.FontWeight.BOLD,
             ),
@@ -1605,8 +1972,8 @@ Description:
         self.page.update()
 
         # Show confirmation
-        item_type_label = "PR" if item.item_type == "pull_request" else "Issue"
-        repo_label = "Target" if item.repo_source == "target" else "Fork"
+        item_type_label = _ITEM_TYPE_BADGES.get(item.item_type, _ISSUE_BADGE)[0]
+        repo_label = _REPO_SOURCE_BADGES.get(item.repo_source, _FORK_BADGE)[0]
         self._show_snackbar(f"Selected {item_type_label} from {repo_label}: {item.title}", error=False)
 
     def _clear_active_item(self, e=None):
@@ -1625,36 +1992,44 @@ Description:
             text_align=ft.TextAlign.CENTER,
         )
 
-        # Update the page
-        self.page.update()
-
-        # Show confirmation
+        # The snackbar's page update also pushes the reset display
         self._show_snackbar("Active item cleared", error=False)
 
     def _show_item_detail(self, item):
         """Show detail dialog for a workflow item"""
         # Get repo string for fetching comments
-        config = self.config_manager.get_config()
-        if item.repo_source == "target":
-            repo_str = config.get('GITHUB_REPO', '')
-        else:
-            repo_str = config.get('FORKED_REPO', '')
+        repo_str = self._repo_for_item(item)
+
+        self.page.run_task(self._show_item_detail_async, item, repo_str)
+
+    async def _show_item_detail_async(self, item, repo_str: str):
+        """Fetch the item's comments in a worker thread, then open its dialog"""
+        # Fetch comments
+        comments = []
+        if repo_str:
+            try:
+                workflow_manager = self._get_workflow_manager()
+                comments = await asyncio.to_thread(
+                    workflow_manager.fetch_comments, repo_str, item.number, item.item_type == "pull_request"
+                )
+                print(f"Fetched {len(comments)} comments for {item.item_type} #{item.number}")
+            except Exception as e:
+                print(f"Error fetching comments: {e}")
+                if self.logger:
+                    self.logger.log(f"Error fetching comments: {e}")
 
         # Build the dialog
-        dialog = self._build_item_detail_dialog(item, repo_str)
+        dialog = self._build_item_detail_dialog(item, repo_str, comments)
 
         # Use Flet 0.28+ API: page.open() instead of page.dialog
         self.page.open(dialog)
 
-    def _build_item_detail_dialog(self, item, repo_str):
+    def _build_item_detail_dialog(self, item, repo_str, comments: List[Dict[str, Any]]):
         """Build the detail dialog with tabs for Main (Preview) and System (extracted data)"""
 
         # Get repo name for display
-        config = self.config_manager.get_config()
-        if item.repo_source == "target":
-            repo_name = config.get('GITHUB_REPO', '')
-        else:
-            repo_name = config.get('FORKED_REPO', '')
+        repo_name = self._repo_for_item(item)
+        type_label, type_color = _ITEM_TYPE_BADGES.get(item.item_type, _ISSUE_BADGE)
 
         # Create header with repo and item info
         header = ft.Container(
@@ -1664,11 +2039,11 @@ Description:
                     ft.Text(repo_name, size=12, weight=ft.FontWeight.BOLD),
                     ft.Container(
                         content=ft.Text(
-                            "PR" if item.item_type == "pull_request" else "Issue",
+                            type_label,
                             size=10,
                             color=ft.colors.WHITE,
                         ),
-                        bgcolor=ft.colors.GREEN if item.item_type == "pull_request" else ft.colors.ORANGE,
+                        bgcolor=type_color,
                         padding=ft.padding.symmetric(horizontal=8, vertical=2),
                         border_radius=4,
                     ),
@@ -1704,25 +2079,13 @@ Description:
                         selectable=True,
                     ),
                     padding=10,
-                    border=ft.border.all(1, ft.colors.OUTLINE),
+                    border=_OUTLINE_BORDER,
                     border_radius=4,
                     bgcolor=ft.colors.GREY_900,
                 ),
             ], spacing=5),
         )
 
-        # Fetch comments
-        comments = []
-        if repo_str:
-            try:
-                workflow_manager = self._get_workflow_manager()
-                comments = workflow_manager.fetch_comments(repo_str, item.number, item.item_type == "pull_request")
-                print(f"Fetched {len(comments)} comments for {item.item_type} #{item.number}")
-            except Exception as e:
-                print(f"Error fetching comments: {e}")
-                if self.logger:
-                    self.logger.log(f"Error fetching comments: {e}")
-
         # Build comments display
         comments_widgets = []
         if comments:
@@ -1741,7 +2104,7 @@ Description:
                         ),
                         padding=8,
                         margin=ft.margin.only(bottom=8),
-                        border=ft.border.all(1, ft.colors.OUTLINE),
+                        border=_OUTLINE_BORDER,
                         border_radius=4,
                         bgcolor=ft.colors.GREY_800,
                     )
@@ -1761,6 +2124,13 @@ Description:
             ], spacing=5),
         )
 
+        # Keep a direct reference so the copy handler can relabel it
+        copy_button = ft.TextButton(
+            "Copy URL",
+            icon=ft.icons.COPY,
+            on_click=lambda e: self._copy_to_clipboard(item.url, copy_button),
+        )
+
         # Main content (no tabs, just single scrollable content)
         main_content = ft.Container(
             content=ft.Column(
@@ -1772,13 +2142,9 @@ Description:
                         ft.ElevatedButton(
                             "Open in GitHub",
                             icon=ft.icons.OPEN_IN_BROWSER,
-                            on_click=lambda e: self.page.launch_url(item.url),
-                        ),
-                        ft.TextButton(
-                            "Copy URL",
-                            icon=ft.icons.COPY,
-                            on_click=lambda e: self._copy_to_clipboard(item.url),
+                            on_click=lambda e: self._open_url(item.url),
                         ),
+                        copy_button,
                     ], spacing=10),
                 ],
                 spacing=15,
@@ -1809,10 +2175,25 @@ Description:
 
         return dialog
 
-    def _copy_to_clipboard(self, text):
+    def _copy_to_clipboard(self, text, button: Optional[ft.TextButton] = None):
         """Copy text to clipboard and show notification"""
         self.page.set_clipboard(text)
-        self._show_snackbar("URL copied to clipboard!", error=False)
+        if button is None:
+            self._show_snackbar("URL copied to clipboard!", error=False)
+            return
+
+        # Confirm on the button itself, then restore its label
+        original_text = button.text
+        button.text = "Copied!"
+        button.update()
+
+        async def restore_label():
+            await asyncio.sleep(1.5)
+            button.text = original_text
+            if button.page:
+                button.update()
+
+        self.page.run_task(restore_label)
 
     def _get_workflow_manager(self):
         """Get or create a WorkflowManager instance"""
@@ -1820,15 +2201,17 @@ Description:
         if not github_token:
             raise ValueError("GitHub token not configured")
 
-        from .workflow import WorkflowManager
-        return WorkflowManager(github_token, self.logger)
+        # Reuse the manager until the token changes
+        if self._workflow_manager is None or self._workflow_manager.token != github_token:
+            self._workflow_manager = WorkflowManager(github_token, self.logger)
+        return self._workflow_manager
 
     def _previous_item(self, e):
         """Navigate to previous item"""
         if self.current_item_index > 0:
             self.current_item_index -= 1
+            # _display_current_item refreshes the navigation buttons itself
             self._display_current_item()
-            self._update_navigation_buttons()
 
     def _toggle_edit_mode(self, e):
         """Toggle edit mode for proposed new text"""
@@ -1851,7 +2234,7 @@ Description:
             self.edit_button_ref.current.icon = ft.icons.EDIT
             self.edit_button_ref.current.tooltip = "Edit"
 
-        self.page.update()
+        self._schedule_update()
 
     def save_custom_instructions(self, e):
         """Save custom AI instructions"""
@@ -1871,7 +2254,7 @@ Description:
         """Clear custom instructions"""
         if self.custom_instructions_ref.current:
             self.custom_instructions_ref.current.value = ""
-            self.page.update()
+            self._schedule_update()
 
     def _create_github_resource(self, e):
         """Create GitHub resource (PR or Issue)"""
@@ -1890,17 +2273,231 @@ Description:
 
     def find_and_load_diff_files(self, e):
         """Find and load .diff files"""
-        # Implementation to find and load diff files
-        pass
+        base_path = self.config_manager.get_settings().local_repo_path
+        if not base_path or not os.path.isdir(base_path):
+            self._show_snackbar("Please set LOCAL_REPO_PATH in settings", error=True)
+            return
+        if self._diff_scan_running:
+            return
+
+        # Claimed here rather than in the task, so a quick double-click cannot start two scans
+        self._diff_scan_running = True
+        self.page.run_task(self._find_diff_files_async, base_path)
+
+    async def _find_diff_files_async(self, base_path: str):
+        """Scan for .diff files off the UI thread, then show the result"""
+        self._show_progress()
+        self.update_status(f"Scanning {base_path} for .diff files...")
+        try:
+            diff_files = await asyncio.to_thread(self._scan_diff_files_worker, base_path)
+        except Exception as ex:
+            self._show_snackbar(f"Error scanning for .diff files: {ex}", error=True)
+            return
+        finally:
+            self._diff_scan_running = False
+            self._hide_progress()
+
+        self.update_status(f"Found {len(diff_files)} .diff file(s)")
+        self._on_diff_scan_done(base_path, diff_files)
+
+    def _scan_diff_files_worker(self, base_path: str) -> List[Tuple[str, str]]:
+        """
+        Find .diff files under base_path, returning (relative_path, full_path) pairs
+
+        Every directory is stat'ed, but only directories whose mtime changed
+        since the last scan are listed again; the rest reuse their .diff files
+        and subdirectories from the persisted diff index. Adding, removing or
+        renaming an entry bumps the mtime of the directory that holds it, so
+        new diffs and new repositories at any depth are picked up.
+        """
+        index = self._load_diff_index()
+        cached_dirs = index.get('dirs', {}) if index.get('base_path') == base_path else {}
+        dirs = {}
+        diff_files = []
+
+        pending = [base_path]
+        while pending:
+            dir_path = pending.pop()
+            try:
+                mtime = os.stat(dir_path).st_mtime
+            except OSError:
+                continue
+
+            cached = cached_dirs.get(dir_path)
+            if cached and cached.get('mtime') == mtime:
+                entry = cached
+            else:
+                entry = self._list_diff_dir(base_path, dir_path, mtime)
+                if entry is None:
+                    continue
+
+            dirs[dir_path] = entry
+            diff_files.extend(entry['files'])
+            pending.extend(entry['subdirs'])
+
+        self._save_diff_index({'base_path': base_path, 'dirs': dirs})
+
+        return [tuple(entry) for entry in diff_files]
+
+    def _is_diff_scan_dir(self, name: str) -> bool:
+        """Whether a directory may contain .diff files worth listing"""
+        return not name.startswith('.') and name not in self.DIFF_SCAN_SKIP_DIRS
+
+    def _list_diff_dir(self, base_path: str, dir_path: str, mtime: float) -> Optional[Dict[str, Any]]:
+        """List one directory's .diff files and scannable subdirectories"""
+        files = []
+        subdirs = []
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            return None
+        # scandir reports the entry type from the directory listing, so
+        # sorting files from directories costs no extra stat
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if self._is_diff_scan_dir(entry.name):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.diff'):
+                    files.append([os.path.relpath(entry.path, base_path), entry.path])
+        return {'mtime': mtime, 'files': files, 'subdirs': subdirs}
+
+    def _load_diff_index(self) -> Dict[str, Any]:
+        """Load the persisted .diff file index (read from disk once per session)"""
+        if self._diff_index is None:
+            try:
+                with open(self.DIFF_INDEX_PATH, 'r', encoding='utf-8') as f:
+                    self._diff_index = json.load(f)
+            except (OSError, ValueError):
+                self._diff_index = {}
+        return self._diff_index
+
+    def _save_diff_index(self, index: Dict[str, Any]):
+        """Persist the .diff file index, skipping the write when nothing changed"""
+        if index == self._diff_index:
+            return
+        self._diff_index = index
+        try:
+            self.DIFF_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.DIFF_INDEX_PATH, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=None)
+        except OSError as ex:
+            print(f"Could not save diff index: {ex}")
+
+    def _on_diff_scan_done(self, base_path: str, diff_files: List[Tuple[str, str]]):
+        """Load the single match or let the user choose between several"""
+        if not diff_files:
+            self._show_snackbar(f"No .diff files found in {base_path}")
+        elif len(diff_files) == 1:
+            self._load_diff_file(diff_files[0][1])
+        else:
+            self._show_diff_file_selection(diff_files)
+
+    def _show_diff_file_selection(self, diff_files: List[Tuple[str, str]]):
+        """Let the user pick one of several .diff files"""
+        diff_files = sorted(diff_files)
+        # Lower-cased once here rather than for every file on every keystroke
+        search_keys = [relative_path.lower() for relative_path, _ in diff_files]
+        search_state = {'generation': 0}
+
+        def select_file(full_path):
+            self.page.close(selection_dialog)
+            self._load_diff_file(full_path)
+
+        def build_rows(entries):
+            # Only render a bounded slice; the search field narrows the rest
+            rows = [
+                ft.ListTile(
+                    title=ft.Text(relative_path, size=13),
+                    dense=True,
+                    on_click=lambda e, path=full_path: select_file(path),
+                )
+                for relative_path, full_path in entries[:self.DIFF_LIST_RENDER_LIMIT]
+            ]
+            if len(entries) > self.DIFF_LIST_RENDER_LIMIT:
+                rows.append(ft.Text(
+                    f"Showing {self.DIFF_LIST_RENDER_LIMIT} of {len(entries)} files - refine the search",
+                    color=ft.colors.GREY_400, italic=True,
+                ))
+            return rows
+
+        # Built in one go and assigned at once, so the page sends a single update
+        results_list = ft.ListView(controls=build_rows(diff_files), expand=True, spacing=2)
+
+        async def apply_filter(generation, query):
+            await asyncio.sleep(0.15)
+            if generation != search_state['generation']:
+                return  # A newer keystroke superseded this one
+            query = query.strip().lower()
+            matches = ([entry for entry, key in zip(diff_files, search_keys) if query in key]
+                       if query else diff_files)
+            results_list.controls = build_rows(matches)
+            self.page.update()
+
+        def on_search_change(e):
+            search_state['generation'] += 1
+            self.page.run_task(apply_filter, search_state['generation'], e.control.value or '')
+
+        controls = []
+        if len(diff_files) > self.DIFF_LIST_RENDER_LIMIT:
+            controls.append(ft.TextField(
+                label="Filter .diff files",
+                prefix_icon=ft.icons.SEARCH,
+                autofocus=True,
+                on_change=on_search_change,
+            ))
+        controls.append(results_list)
+
+        selection_dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Text(f"Select a .diff file ({len(diff_files)} found)"),
+            content=ft.Container(
+                content=ft.Column(controls, spacing=10),
+                width=600,
+                height=400,
+            ),
+            actions=[
+                ft.TextButton("Cancel", on_click=lambda e: self.page.close(selection_dialog)),
+            ],
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
+
+        self.page.open(selection_dialog)
+
+    def _load_diff_file(self, file_path: str):
+        """Load a .diff file into the diff view"""
+        try:
+            if os.path.getsize(file_path) > self.DIFF_MMAP_THRESHOLD:
+                # Let the OS page the file in; lines are decoded while cleaning
+                self._show_diff_runs(*_mapped_diff_runs(file_path))
+            else:
+                with open(file_path, 'r', encoding='utf-8', errors='replace', buffering=-1, newline='') as f:
+                    diff_content = f.read()
+                self.update_diff_display(diff_content)
+            if self.logger:
+                self.logger.log(f"📄 Loaded diff file: {file_path}")
+        except Exception as ex:
+            self._show_snackbar(f"Error loading diff file: {ex}", error=True)
 
     def clear_diff_display(self, e):
         """Clear the diff display"""
         if self.diff_text_ref.current:
-            self.diff_text_ref.current.value = ""
-            self.page.update()
+            self._shown_diff = (None, None)
+            with self._updating(self.diff_text_ref.current):
+                self.diff_text_ref.current.value = ""
+                self.diff_text_ref.current.spans = []
 
     # ===== Async Operations =====
 
+    def _has_cached_items(self, target_repo: str, forked_repo: str) -> bool:
+        """Check whether any workflow item cache exists for the selected repos"""
+        if not self.cache_manager:
+            return False
+
+        probes = (('target_prs', target_repo), ('target_issues', target_repo),
+                  ('fork_prs', forked_repo), ('fork_issues', forked_repo))
+        return any(repo and self.cache_manager.is_cache_valid(kind, repo) for kind, repo in probes)
+
     async def _auto_load_cached_items(self):
         """Auto-load cached items on startup if available"""
         print("=" * 60)
@@ -1910,13 +2507,18 @@ Description:
         def load_cached():
             try:
                 # Get configured repos
-                target_repo = self.target_repo_dropdown_ref.current.value if self.target_repo_dropdown_ref.current else None
-                forked_repo = self.forked_repo_dropdown_ref.current.value if self.forked_repo_dropdown_ref.current else None
+                target_repo = self._clean_repo_choice(self.target_repo_dropdown)
+                forked_repo = self._clean_repo_choice(self.forked_repo_dropdown)
 
                 if not target_repo and not forked_repo:
                     print("No repositories configured, skipping auto-load")
                     return
 
+                # Stat-only probe first: skip the loader when nothing is cached
+                if not self._has_cached_items(target_repo, forked_repo):
+                    print("No cached items found, waiting for manual load")
+                    return
+
                 github_token = self.config_manager.get_config().get('GITHUB_PAT', '')
                 if not github_token:
                     print("No GitHub token configured, skipping auto-load")
@@ -1925,12 +2527,11 @@ Description:
                 items_loaded = False
 
                 # Try to load target repo items from cache
-                if target_repo and not target_repo.startswith('---') and '/' in target_repo:
+                if target_repo:
                     cached_prs = self.cache_manager.load_from_cache('target_prs', target_repo) if self.cache_manager else None
                     cached_issues = self.cache_manager.load_from_cache('target_issues', target_repo) if self.cache_manager else None
 
                     if cached_prs is not None:
-                        from .workflow import WorkflowItem
                         self.workflow_items['target_prs'] = [WorkflowItem.from_dict(item) for item in cached_prs]
                         print(f"✓ Auto-loaded {len(cached_prs)} PRs from cache (target)")
                         if self.logger:
@@ -1938,7 +2539,6 @@ Description:
                         items_loaded = True
 
                     if cached_issues is not None:
-                        from .workflow import WorkflowItem
                         self.workflow_items['target_issues'] = [WorkflowItem.from_dict(item) for item in cached_issues]
                         print(f"✓ Auto-loaded {len(cached_issues)} issues from cache (target)")
                         if self.logger:
@@ -1946,12 +2546,11 @@ Description:
                         items_loaded = True
 
                 # Try to load fork repo items from cache
-                if forked_repo and not forked_repo.startswith('---') and '/' in forked_repo:
+                if forked_repo:
                     cached_fork_prs = self.cache_manager.load_from_cache('fork_prs', forked_repo) if self.cache_manager else None
                     cached_fork_issues = self.cache_manager.load_from_cache('fork_issues', forked_repo) if self.cache_manager else None
 
                     if cached_fork_prs is not None:
-                        from .workflow import WorkflowItem
                         self.workflow_items['fork_prs'] = [WorkflowItem.from_dict(item) for item in cached_fork_prs]
                         print(f"✓ Auto-loaded {len(cached_fork_prs)} PRs from cache (fork)")
                         if self.logger:
@@ -1959,7 +2558,6 @@ Description:
                         items_loaded = True
 
                     if cached_fork_issues is not None:
-                        from .workflow import WorkflowItem
                         self.workflow_items['fork_issues'] = [WorkflowItem.from_dict(item) for item in cached_fork_issues]
                         print(f"✓ Auto-loaded {len(cached_fork_issues)} issues from cache (fork)")
                         if self.logger:
@@ -1967,11 +2565,8 @@ Description:
                         items_loaded = True
 
                 if items_loaded:
-                    # Filter and update UI
-                    self.page.run_task(self._filter_workflow_items_async)
-
-                    # Populate all items list in sidebar
-                    self._populate_all_items()
+                    # Collect items and repopulate the sidebar in one pass
+                    self._refresh_after_load()
 
                     print("✅ Auto-load completed successfully")
                 else:
@@ -1991,8 +2586,13 @@ Description:
         def load_cached():
             try:
                 # Get configured repos
-                target_repo = self.target_repo_dropdown_ref.current.value if self.target_repo_dropdown_ref.current else None
-                forked_repo = self.forked_repo_dropdown_ref.current.value if self.forked_repo_dropdown_ref.current else None
+                target_repo = self._clean_repo_choice(self.target_repo_dropdown)
+                forked_repo = self._clean_repo_choice(self.forked_repo_dropdown)
+
+                # Stat-only probe first: skip the loader when nothing is cached
+                if not self._has_cached_items(target_repo, forked_repo):
+                    print("No cached items found for selected repositories")
+                    return
 
                 github_token = self.config_manager.get_config().get('GITHUB_PAT', '')
                 if not github_token:
@@ -2002,12 +2602,11 @@ Description:
                 items_loaded = False
 
                 # Try to load target repo items from cache
-                if target_repo and not target_repo.startswith('---') and '/' in target_repo:
+                if target_repo:
                     cached_prs = self.cache_manager.load_from_cache('target_prs', target_repo) if self.cache_manager else None
                     cached_issues = self.cache_manager.load_from_cache('target_issues', target_repo) if self.cache_manager else None
 
                     if cached_prs is not None:
-                        from .workflow import WorkflowItem
                         self.workflow_items['target_prs'] = [WorkflowItem.from_dict(item) for item in cached_prs]
                         print(f"✓ Loaded {len(cached_prs)} cached PRs for target: {target_repo}")
                         if self.logger:
@@ -2015,7 +2614,6 @@ Description:
                         items_loaded = True
 
                     if cached_issues is not None:
-                        from .workflow import WorkflowItem
                         self.workflow_items['target_issues'] = [WorkflowItem.from_dict(item) for item in cached_issues]
                         print(f"✓ Loaded {len(cached_issues)} cached issues for target: {target_repo}")
                         if self.logger:
@@ -2023,12 +2621,11 @@ Description:
                         items_loaded = True
 
                 # Try to load fork repo items from cache
-                if forked_repo and not forked_repo.startswith('---') and '/' in forked_repo:
+                if forked_repo:
                     cached_fork_prs = self.cache_manager.load_from_cache('fork_prs', forked_repo) if self.cache_manager else None
                     cached_fork_issues = self.cache_manager.load_from_cache('fork_issues', forked_repo) if self.cache_manager else None
 
                     if cached_fork_prs is not None:
-                        from .workflow import WorkflowItem
                         self.workflow_items['fork_prs'] = [WorkflowItem.from_dict(item) for item in cached_fork_prs]
                         print(f"✓ Loaded {len(cached_fork_prs)} cached PRs for fork: {forked_repo}")
                         if self.logger:
@@ -2036,7 +2633,6 @@ Description:
                         items_loaded = True
 
                     if cached_fork_issues is not None:
-                        from .workflow import WorkflowItem
                         self.workflow_items['fork_issues'] = [WorkflowItem.from_dict(item) for item in cached_fork_issues]
                         print(f"✓ Loaded {len(cached_fork_issues)} cached issues for fork: {forked_repo}")
                         if self.logger:
@@ -2044,11 +2640,8 @@ Description:
                         items_loaded = True
 
                 if items_loaded:
-                    # Filter and update UI
-                    self.page.run_task(self._filter_workflow_items_async)
-
-                    # Populate all items list in sidebar
-                    self._populate_all_items()
+                    # Collect items and repopulate the sidebar in one pass
+                    self._refresh_after_load()
 
                     print("✅ Cached items loaded for selected repositories")
                     if self.logger:
@@ -2088,13 +2681,12 @@ Description:
                 if not github_token:
                     return
 
-                from .workflow import GitHubRepoFetcher
                 repo_fetcher = GitHubRepoFetcher(github_token, self.logger)
                 repos = repo_fetcher.fetch_repos_with_permissions(min_permission='push')
                 self.target_repos = repo_fetcher.get_repo_names(repos)
 
                 # Update UI
-                if self.target_repo_dropdown_ref.current:
+                if self.target_repo_dropdown:
                     self.page.run_task(self._update_target_dropdown_async)
 
             except Exception as e:
@@ -2105,7 +2697,7 @@ Description:
 
     async def _update_target_dropdown_async(self):
         """Update target repository dropdown"""
-        if not self.target_repo_dropdown_ref.current:
+        if not self.target_repo_dropdown:
             return
 
         options = []
@@ -2113,12 +2705,12 @@ Description:
             options.append(ft.dropdown.Option("--- Your Repos (with edit access) ---", disabled=True))
             options.extend([ft.dropdown.Option(repo) for repo in self.target_repos])
 
-        self.target_repo_dropdown_ref.current.options = options
+        self.target_repo_dropdown.options = options
 
         # Set value from saved settings
         saved_repo = self.config_manager.get_config().get('GITHUB_REPO', '')
         if saved_repo:
-            self.target_repo_dropdown_ref.current.value = saved_repo
+            self.target_repo_dropdown.value = saved_repo
 
         self.page.update()
 
@@ -2165,7 +2757,6 @@ Description:
                     self.page.update()
                     return
 
-                from .workflow import GitHubRepoFetcher
                 repo_fetcher = GitHubRepoFetcher(github_token, self.logger)
 
                 # Check if it's a direct repo reference (owner/repo)
@@ -2175,7 +2766,7 @@ Description:
                     if repos:
                         results_list.controls.clear()
                         for repo in repos:
-                            repo_name = repo_fetcher.get_repo_names([repo])[0] if repo_fetcher.get_repo_names([repo]) else None
+                            repo_name = repo.get('full_name')
                             if repo_name:
                                 results_list.controls.append(
                                     self._create_repo_result_item(repo_name, repo, search_dialog)
@@ -2192,7 +2783,7 @@ Description:
 
                     if repos:
                         for repo in repos:
-                            repo_name = repo_fetcher.get_repo_names([repo])[0] if repo_fetcher.get_repo_names([repo]) else None
+                            repo_name = repo.get('full_name')
                             if repo_name:
                                 results_list.controls.append(
                                     self._create_repo_result_item(repo_name, repo, search_dialog)
@@ -2259,20 +2850,18 @@ Description:
 
         def select_repo(e):
             # Add to dropdown options if not already there
-            if self.target_repo_dropdown_ref.current:
-                current_options = [opt.key for opt in self.target_repo_dropdown_ref.current.options]
+            if self.target_repo_dropdown:
+                current_options = [opt.key for opt in self.target_repo_dropdown.options]
                 if repo_name not in current_options:
-                    self.target_repo_dropdown_ref.current.options.append(
+                    self.target_repo_dropdown.options.append(
                         ft.dropdown.Option(repo_name)
                     )
 
                 # Select this repo
-                self.target_repo_dropdown_ref.current.value = repo_name
+                self.target_repo_dropdown.value = repo_name
 
-                # Save to config
-                config = self.config_manager.get_config()
-                config['GITHUB_REPO'] = repo_name
-                self.config_manager.save_configuration(config)
+                # Save to config (merged into the stored settings)
+                self.config_manager.save_configuration({'GITHUB_REPO': repo_name})
 
                 self.page.update()
 
@@ -2294,7 +2883,7 @@ Description:
                 ft.Text(description, size=12, color=ft.colors.GREY_400),
             ], spacing=5),
             padding=10,
-            border=ft.border.all(1, ft.colors.OUTLINE),
+            border=_OUTLINE_BORDER,
             border_radius=4,
             bgcolor=ft.colors.GREY_800,
             on_click=select_repo,
@@ -2303,38 +2892,39 @@ Description:
 
     async def _load_forked_repos_async(self):
         """Load forked repositories"""
-        def load_forks():
-            try:
-                # Load local repos
-                local_repo_path = self.config_manager.get_config().get('LOCAL_REPO_PATH', '')
-                if local_repo_path:
-                    try:
-                        from .utils import LocalRepositoryScanner
-                        self.forked_repos['local'] = LocalRepositoryScanner.scan_local_repos(local_repo_path)
-                    except Exception as e:
-                        print(f"Error scanning local repos: {e}")
-
-                # Load GitHub repos
-                github_token = self.config_manager.get_config().get('GITHUB_PAT', '')
-                if github_token:
-                    from .workflow import GitHubRepoFetcher
-                    repo_fetcher = GitHubRepoFetcher(github_token, self.logger)
-                    repos = repo_fetcher.fetch_user_repos(repo_type='owner')
-                    self.forked_repos['github'] = repo_fetcher.get_repo_names(repos)
+        def load_local_repos():
+            local_repo_path = self.config_manager.get_config().get('LOCAL_REPO_PATH', '')
+            if local_repo_path:
+                try:
+                    self.forked_repos['local'] = LocalRepositoryScanner.scan_local_repos(local_repo_path)
+                except Exception as e:
+                    print(f"Error scanning local repos: {e}")
+
+        def load_github_repos():
+            github_token = self.config_manager.get_config().get('GITHUB_PAT', '')
+            if github_token:
+                repo_fetcher = GitHubRepoFetcher(github_token, self.logger)
+                repos = repo_fetcher.fetch_user_repos(repo_type='owner')
+                self.forked_repos['github'] = repo_fetcher.get_repo_names(repos)
 
-                # Update UI
-                if self.forked_repo_dropdown_ref.current:
-                    self.page.run_task(self._update_forked_dropdown_async)
+        try:
+            # The local scan and the GitHub listing are independent, so overlap them
+            await asyncio.gather(
+                asyncio.to_thread(load_local_repos),
+                asyncio.to_thread(load_github_repos),
+            )
 
-            except Exception as e:
-                if self.logger:
-                    self.logger.log(f"Error loading forked repos: {e}")
+            # Update UI
+            if self.forked_repo_dropdown:
+                await self._update_forked_dropdown_async()
 
-        await asyncio.to_thread(load_forks)
+        except Exception as e:
+            if self.logger:
+                self.logger.log(f"Error loading forked repos: {e}")
 
     async def _update_forked_dropdown_async(self):
         """Update forked repository dropdown"""
-        if not self.forked_repo_dropdown_ref.current:
+        if not self.forked_repo_dropdown:
             return
 
         options = []
@@ -2349,12 +2939,12 @@ Description:
             options.append(ft.dropdown.Option("--- Your GitHub Repos ---", disabled=True))
             options.extend([ft.dropdown.Option(repo) for repo in self.forked_repos['github']])
 
-        self.forked_repo_dropdown_ref.current.options = options
+        self.forked_repo_dropdown.options = options
 
         # Set value from saved settings
         saved_repo = self.config_manager.get_config().get('FORKED_REPO', '')
         if saved_repo:
-            self.forked_repo_dropdown_ref.current.value = saved_repo
+            self.forked_repo_dropdown.value = saved_repo
 
         self.page.update()
 
@@ -2370,7 +2960,7 @@ Description:
     async def _load_workflow_items_async(self):
         """Load workflow items (PRs/Issues)"""
         # Check if items are already loaded to determine if this is a refresh
-        items_already_loaded = any(len(items) > 0 for items in self.workflow_items.values())
+        items_already_loaded = self.workflow_items_total > 0
         force_refresh = items_already_loaded
 
         if force_refresh:
@@ -2392,15 +2982,15 @@ Description:
 
         def load_items():
             try:
-                print(f"DEBUG: target_repo_dropdown exists: {self.target_repo_dropdown_ref.current is not None}")
-                print(f"DEBUG: forked_repo_dropdown exists: {self.forked_repo_dropdown_ref.current is not None}")
+                print(f"DEBUG: target_repo_dropdown exists: {self.target_repo_dropdown is not None}")
+                print(f"DEBUG: forked_repo_dropdown exists: {self.forked_repo_dropdown is not None}")
 
-                if self.target_repo_dropdown_ref.current:
-                    print(f"DEBUG: target_repo value = '{self.target_repo_dropdown_ref.current.value}'")
-                if self.forked_repo_dropdown_ref.current:
-                    print(f"DEBUG: forked_repo value = '{self.forked_repo_dropdown_ref.current.value}'")
+                if self.target_repo_dropdown:
+                    print(f"DEBUG: target_repo value = '{self.target_repo_dropdown.value}'")
+                if self.forked_repo_dropdown:
+                    print(f"DEBUG: forked_repo value = '{self.forked_repo_dropdown.value}'")
 
-                if not self.target_repo_dropdown_ref.current and not self.forked_repo_dropdown_ref.current:
+                if not self.target_repo_dropdown and not self.forked_repo_dropdown:
                     if self.logger:
                         self.logger.log("❌ No repositories dropdown controls found")
                     print("ERROR: No repo dropdowns found!")
@@ -2413,19 +3003,23 @@ Description:
                     print("ERROR: No GitHub token!")
                     return
 
-                from .workflow import WorkflowManager
                 workflow_manager = WorkflowManager(github_token, self.logger)
 
                 # Load from target repo
-                target_repo = self.target_repo_dropdown_ref.current.value if self.target_repo_dropdown_ref.current else None
+                target_repo = self._clean_repo_choice(self.target_repo_dropdown)
+                forked_repo = self._clean_repo_choice(self.forked_repo_dropdown)
+
+                # Cache misses share one fetch covering both repos (single GraphQL roundtrip)
+                fetched = {}
+
+                def fetched_items(key):
+                    if not fetched:
+                        fetched.update(workflow_manager.fetch_all_workflow_items(target_repo, forked_repo))
+                    return fetched[key]
                 print(f"DEBUG: target_repo extracted = '{target_repo}'")
-                print(f"DEBUG: Validation checks:")
-                print(f"  - target_repo is not None: {target_repo is not None}")
-                print(f"  - not starts with '---': {not target_repo.startswith('---') if target_repo else 'N/A'}")
-                print(f"  - contains '/': {'/' in target_repo if target_repo else 'N/A'}")
 
                 # Filter out separator headers and None values
-                if target_repo and not target_repo.startswith('---') and '/' in target_repo:
+                if target_repo:
                     print(f"✓ Validation PASSED for target repo: {target_repo}")
                     if self.logger:
                         self.logger.log(f"📥 Loading PRs and issues from target repo: {target_repo}")
@@ -2436,33 +3030,29 @@ Description:
 
                     if cached_prs is not None and not force_refresh:
                         # Convert cached dicts back to WorkflowItem objects
-                        from .workflow import WorkflowItem
                         self.workflow_items['target_prs'] = [WorkflowItem.from_dict(item) for item in cached_prs]
                         print(f"✓ Loaded {len(cached_prs)} PRs from cache")
                         if self.logger:
                             self.logger.log(f"✅ Loaded {len(cached_prs)} PRs from cache")
                     else:
-                        print(f"Calling workflow_manager.fetch_pull_requests('{target_repo}')...")
-                        self.workflow_items['target_prs'] = workflow_manager.fetch_pull_requests(target_repo, repo_source='target')
+                        self.workflow_items['target_prs'] = fetched_items('target_prs')
                         # Convert to dicts and save to cache
                         if self.cache_manager:
                             items_as_dicts = [item.to_dict() for item in self.workflow_items['target_prs']]
-                            self.cache_manager.save_to_cache('target_prs', target_repo, items_as_dicts)
+                            self.cache_manager.save_to_cache('target_prs', target_repo, items_as_dicts, async_write=True)
 
                     if cached_issues is not None and not force_refresh:
                         # Convert cached dicts back to WorkflowItem objects
-                        from .workflow import WorkflowItem
                         self.workflow_items['target_issues'] = [WorkflowItem.from_dict(item) for item in cached_issues]
                         print(f"✓ Loaded {len(cached_issues)} issues from cache")
                         if self.logger:
                             self.logger.log(f"✅ Loaded {len(cached_issues)} issues from cache")
                     else:
-                        print(f"Calling workflow_manager.fetch_issues('{target_repo}')...")
-                        self.workflow_items['target_issues'] = workflow_manager.fetch_issues(target_repo, repo_source='target')
+                        self.workflow_items['target_issues'] = fetched_items('target_issues')
                         # Convert to dicts and save to cache
                         if self.cache_manager:
                             items_as_dicts = [item.to_dict() for item in self.workflow_items['target_issues']]
-                            self.cache_manager.save_to_cache('target_issues', target_repo, items_as_dicts)
+                            self.cache_manager.save_to_cache('target_issues', target_repo, items_as_dicts, async_write=True)
 
                     pr_count = len(self.workflow_items.get('target_prs', []))
                     issue_count = len(self.workflow_items.get('target_issues', []))
@@ -2473,10 +3063,13 @@ Description:
                 else:
                     print(f"✗ Validation FAILED for target repo: {target_repo}")
 
+                # Show the target repo's items while the fork is still loading
+                if target_repo and forked_repo:
+                    self._populate_all_items()
+
                 # Load from forked repo
-                forked_repo = self.forked_repo_dropdown_ref.current.value if self.forked_repo_dropdown_ref.current else None
                 # Filter out separator headers and None values
-                if forked_repo and not forked_repo.startswith('---') and '/' in forked_repo:
+                if forked_repo:
                     if self.logger:
                         self.logger.log(f"Loading PRs and issues from forked repo: {forked_repo}")
 
@@ -2486,52 +3079,69 @@ Description:
 
                     if cached_fork_prs is not None and not force_refresh:
                         # Convert cached dicts back to WorkflowItem objects
-                        from .workflow import WorkflowItem
                         self.workflow_items['fork_prs'] = [WorkflowItem.from_dict(item) for item in cached_fork_prs]
                         print(f"✓ Loaded {len(cached_fork_prs)} PRs from cache (fork)")
                         if self.logger:
                             self.logger.log(f"✅ Loaded {len(cached_fork_prs)} PRs from cache (fork)")
                     else:
-                        self.workflow_items['fork_prs'] = workflow_manager.fetch_pull_requests(forked_repo, repo_source='fork')
+                        self.workflow_items['fork_prs'] = fetched_items('fork_prs')
                         # Convert to dicts and save to cache
                         if self.cache_manager:
                             items_as_dicts = [item.to_dict() for item in self.workflow_items['fork_prs']]
-                            self.cache_manager.save_to_cache('fork_prs', forked_repo, items_as_dicts)
+                            self.cache_manager.save_to_cache('fork_prs', forked_repo, items_as_dicts, async_write=True)
 
                     if cached_fork_issues is not None and not force_refresh:
                         # Convert cached dicts back to WorkflowItem objects
-                        from .workflow import WorkflowItem
                         self.workflow_items['fork_issues'] = [WorkflowItem.from_dict(item) for item in cached_fork_issues]
                         print(f"✓ Loaded {len(cached_fork_issues)} issues from cache (fork)")
                         if self.logger:
                             self.logger.log(f"✅ Loaded {len(cached_fork_issues)} issues from cache (fork)")
                     else:
-                        self.workflow_items['fork_issues'] = workflow_manager.fetch_issues(forked_repo, repo_source='fork')
+                        self.workflow_items['fork_issues'] = fetched_items('fork_issues')
                         # Convert to dicts and save to cache
                         if self.cache_manager:
                             items_as_dicts = [item.to_dict() for item in self.workflow_items['fork_issues']]
-                            self.cache_manager.save_to_cache('fork_issues', forked_repo, items_as_dicts)
+                            self.cache_manager.save_to_cache('fork_issues', forked_repo, items_as_dicts, async_write=True)
 
                     if self.logger:
                         self.logger.log(f"Loaded {len(self.workflow_items.get('fork_prs', []))} PRs and {len(self.workflow_items.get('fork_issues', []))} issues from forked repo")
 
-                # Filter and update UI
-                self.page.run_task(self._filter_workflow_items_async)
-
-                # Populate all items list in sidebar
-                self._populate_all_items()
+                # Collect items and repopulate the sidebar in one pass
+                self._refresh_after_load()
 
             except Exception as e:
                 if self.logger:
                     self.logger.log(f"Error loading workflow items: {e}")
-                    import traceback
                     self.logger.log(traceback.format_exc())
 
         await asyncio.to_thread(load_items)
 
     async def _filter_workflow_items_async(self):
-        """Filter workflow items async"""
-        self._filter_workflow_items()
+        """Filter workflow items once a burst of requests has settled"""
+        self._filter_generation += 1
+        generation = self._filter_generation
+        await asyncio.sleep(self.FILTER_DEBOUNCE_SECONDS)
+        # Only the last request in a burst does the work
+        if generation == self._filter_generation:
+            with self._updating(self.item_counter):
+                self._do_filter_workflow_items()
+
+    def _refresh_after_load(self):
+        """
+        Schedule the post-load UI refresh
+
+        Safe to call from worker threads. Loads finishing in quick succession
+        share one refresh instead of rebuilding the list once each.
+        """
+        self._debounce('refresh_after_load', self.FILTER_DEBOUNCE_SECONDS, self._do_refresh_after_load)
+
+    def _do_refresh_after_load(self):
+        """Collect workflow items, then update the counter and sidebar list together"""
+        # A pending plain collection is covered by this one
+        self._filter_generation += 1
+        with self._updating(self.item_counter):
+            self._do_filter_workflow_items()
+            self._populate_all_items()
 
     # ===== Helper Methods =====
 
@@ -2542,58 +3152,95 @@ Description:
 
         item = self.current_work_items[self.current_item_index]
 
-        # Update UI fields
-        if self.work_item_id_ref.current:
-            self.work_item_id_ref.current.value = f"Work Item {item.get('id', 'N/A')}"
-
-        if self.nature_text_ref.current:
-            self.nature_text_ref.current.value = item.get('nature', '')
-
-        if self.live_doc_url_ref.current:
-            self.live_doc_url_ref.current.value = item.get('live_doc_url', '')
+        # Update UI fields, touching only those whose text differs from what
+        # is already shown (neighbouring items often share doc URL or nature)
+        fields = (
+            (self.work_item_id_ref, f"Work Item {item.get('id', 'N/A')}"),
+            (self.nature_text_ref, item.get('nature', '')),
+            (self.live_doc_url_ref, item.get('live_doc_url', '')),
+            (self.text_to_change_ref, item.get('old_text', '')),
+            (self.proposed_new_text_ref, item.get('new_text', '')),
+        )
+        for ref, value in fields:
+            control = ref.current
+            if control is not None and control.value != value:
+                control.value = value
+                if control.page:
+                    control.update()
 
-        if self.text_to_change_ref.current:
-            self.text_to_change_ref.current.value = item.get('old_text', '')
+        self._update_navigation_buttons()
 
-        if self.proposed_new_text_ref.current:
-            self.proposed_new_text_ref.current.value = item.get('new_text', '')
+    @contextmanager
+    def _updating(self, *controls):
+        """
+        Push all changes made inside the block with one update per control
 
-        self.page.update()
-        self._update_navigation_buttons()
+        Updating just the touched controls avoids diffing the whole page tree,
+        no matter how many properties the block changes.
+        """
+        try:
+            yield
+        finally:
+            for control in controls:
+                if control is not None and control.page:
+                    control.update()
 
     def update_status(self, message: str):
-        """Update status message"""
-        if self.status_text_ref.current:
-            self.status_text_ref.current.value = message
-            self.page.update()
+        """
+        Update status message
+
+        Only the status text is sent to the client, not the whole page.
+        """
+        status_text = self.status_text_ref.current
+        if status_text:
+            status_text.value = message
+            if status_text.page:
+                status_text.update()
 
     def _show_progress(self):
         """Show progress bar"""
-        if self.progress_bar_ref.current:
-            self.progress_bar_ref.current.visible = True
-            self.page.update()
+        progress_bar = self.progress_bar_ref.current
+        if progress_bar:
+            progress_bar.visible = True
+            progress_bar.update()
 
     def _hide_progress(self):
         """Hide progress bar"""
-        if self.progress_bar_ref.current:
-            self.progress_bar_ref.current.visible = False
-            self.page.update()
+        progress_bar = self.progress_bar_ref.current
+        if progress_bar:
+            progress_bar.visible = False
+            progress_bar.update()
+
+    def _open_url(self, url: str):
+        """Open a URL in the browser, ignoring rapid repeat clicks on it"""
+        now = time.monotonic()
+        last_url, last_time = self._last_open
+        if url == last_url and now - last_time < _URL_REOPEN_INTERVAL:
+            return
+        self._last_open = (url, now)
+        self.page.launch_url(url)
 
     def _show_snackbar(self, message: str, error: bool = False):
         """Show snackbar notification"""
-        self.page.snack_bar = ft.SnackBar(
-            content=ft.Text(message),
-            bgcolor="error" if error else "green",
-        )
-        self.page.snack_bar.open = True
+        # Reusing one SnackBar means the update only sends the changed text,
+        # colour and open flag instead of a fresh control
+        snackbar = self._snackbar
+        if snackbar is None:
+            snackbar = self._snackbar = ft.SnackBar(content=ft.Text(message))
+        snackbar.content.value = message
+        snackbar.bgcolor = "error" if error else "green"
+        snackbar.open = True
+        self.page.snack_bar = snackbar
         self.page.update()
 
     def _open_settings(self, e):
         """Open settings dialog"""
-        try:
-            print("Settings button clicked!")
+        print("Settings button clicked!")
+        self.page.run_task(self._run_settings_dialog, "Error opening settings")
 
-            # Use Flet 0.28+ API: page.open() instead of page.dialog
+    async def _run_settings_dialog(self, error_prefix: str):
+        """Show the settings dialog and apply its result once it closes"""
+        try:
             config = self.config_manager.get_config()
             print(f"Got config: {config.keys() if config else 'None'}")
 
@@ -2605,27 +3252,26 @@ Description:
             )
             print("SettingsDialog created")
 
-            def on_settings_result(result):
-                if result:
-                    # Reload configuration
-                    self.config_manager.load_configuration()
-                    self._show_snackbar("Settings saved successfully!")
-
-            print("Calling settings_dialog.show()...")
-            settings_dialog.show(on_result=on_settings_result)
-            print("settings_dialog.show() completed")
+            # Awaiting the dialog leaves the event loop free while it is open
+            if await settings_dialog.show_async():
+                # Reload configuration
+                self.config_manager.load_configuration()
+                self._show_snackbar("Settings saved successfully!")
 
         except Exception as ex:
-            print(f"Error in _open_settings: {ex}")
-            import traceback
+            print(f"{error_prefix}: {ex}")
             traceback.print_exc()
-            self._show_snackbar(f"Error opening settings: {ex}", error=True)
+            self._show_snackbar(f"{error_prefix}: {ex}", error=True)
 
     def _open_processing_log(self, e):
         """Open processing log dialog"""
         try:
             print("Processing Log button clicked!")
 
+            # Show any lines still waiting in the logger's batch
+            if self.logger:
+                self.logger.flush()
+
             processing_log_dialog = ProcessingLogDialog(
                 self.page,
                 self.log_text_ref
@@ -2637,45 +3283,18 @@ Description:
 
         except Exception as ex:
             print(f"Error in _open_processing_log: {ex}")
-            import traceback
             traceback.print_exc()
             self._show_snackbar(f"Error opening processing log: {ex}", error=True)
 
     def _show_real_settings(self):
         """Show the real settings dialog"""
-        try:
-            config = self.config_manager.get_config()
-            print(f"Got config: {config.keys() if config else 'None'}")
-
-            settings_dialog = SettingsDialog(
-                self.page,
-                config,
-                self.config_manager,
-                self.cache_manager
-            )
-            print("SettingsDialog created")
-
-            def on_settings_result(result):
-                if result:
-                    # Reload configuration
-                    self.config_manager.load_configuration()
-                    self._show_snackbar("Settings saved successfully!")
-
-            print("Calling settings_dialog.show()...")
-            settings_dialog.show(on_result=on_settings_result)
-            print("settings_dialog.show() completed")
-        except Exception as ex:
-            print(f"Error in _show_real_settings: {ex}")
-            import traceback
-            traceback.print_exc()
-            self._show_snackbar(f"Error showing settings: {ex}", error=True)
+        self.page.run_task(self._run_settings_dialog, "Error showing settings")
 
     def _check_ai_modules_manual(self, e):
         """Manually check AI modules"""
-        config = self.config_manager.get_config()
-        ai_provider = config.get('AI_PROVIDER', 'none').lower()
+        ai_provider = self.config_manager.get_settings().ai_provider
 
-        if ai_provider and ai_provider != 'none':
+        if ai_provider != 'none':
             self.page.run_task(lambda: self._check_ai_provider_async(ai_provider))
         else:
             self._show_snackbar("No AI provider configured")
@@ -2695,11 +3314,35 @@ Description:
         except Exception as e:
             self._show_snackbar(f"Error checking AI provider: {e}", error=True)
 
-    def update_diff_display(self, diff_content: str):
+    def _build_diff_spans(self, runs: Tuple[Tuple[str, str], ...]) -> List[ft.TextSpan]:
+        """
+        Build styled spans for a diff, one span per run of same-tag lines
+
+        Collapsing contiguous runs keeps line order while sending only a
+        handful of spans to the client instead of one per line.
+        """
+        return [ft.TextSpan(text, self._DIFF_STYLES[tag]) for tag, text in runs]
+
+    def update_diff_display(self, diff_content: Union[str, bytes]):
         """Update diff display"""
         if self.diff_text_ref.current:
-            self.diff_text_ref.current.value = diff_content
-            self.page.update()
+            self._show_diff_runs(*_diff_runs(diff_content or ''))
+
+    def _show_diff_runs(self, runs: Tuple[Tuple[str, str], ...], file_count: int):
+        """Render cleaned diff runs and report the file count"""
+        diff_text = self.diff_text_ref.current
+        if diff_text:
+            # _diff_runs is memoized, so the same diff yields the same runs
+            # object; re-rendering it would resend every span for nothing
+            shown_text, shown_runs = self._shown_diff
+            rerender = shown_text is not diff_text or shown_runs is not runs
+            self._shown_diff = (diff_text, runs)
+            with self._updating(diff_text if rerender else None, self.status_text_ref.current):
+                if rerender:
+                    diff_text.value = None
+                    diff_text.spans = self._build_diff_spans(runs)
+                if runs and self.status_text_ref.current:
+                    self.status_text_ref.current.value = f"Diff loaded: {file_count} file(s) changed"
 
     def _create_ai_plan_tab(self) -> ft.Container:
         """Create the AI Action Plan tab"""
@@ -2751,7 +3394,7 @@ Description:
                     text="Generate Plan",
                     icon=ft.icons.PSYCHOLOGY,
                     on_click=self._on_generate_plan_click,
-                    disabled=True,  # Enable when item is selected
+                    disabled=self.active_workflow_item is None,  # Enable when item is selected
                 ),
                 ft.ElevatedButton(
                     ref=self.execute_plan_button_ref,
@@ -2808,12 +3451,10 @@ Description:
             self._show_snackbar("Please select a PR or Issue first", error=True)
             return
 
-        # Run in thread to avoid blocking UI
-        import threading
-        thread = threading.Thread(target=self._generate_plan_async)
-        thread.start()
+        # Run on the page's event loop; only the AI call goes to a worker thread
+        self.page.run_task(self._generate_plan_async)
 
-    def _generate_plan_async(self):
+    async def _generate_plan_async(self):
         """Generate plan asynchronously"""
         try:
             # Update UI - disable both buttons during generation
@@ -2828,7 +3469,6 @@ Description:
             self.page.update()
 
             # Create action planner
-            from .ai_action_planner import AIActionPlanner
             planner = AIActionPlanner(self.ai_manager, self.logger, self.config_manager)
 
             # Get custom instructions
@@ -2837,7 +3477,7 @@ Description:
                 custom_instructions = self.ai_instructions_ref.current.value or ""
 
             # Generate plan
-            plan = planner.generate_plan(self.active_workflow_item, custom_instructions)
+            plan = await asyncio.to_thread(planner.generate_plan, self.active_workflow_item, custom_instructions)
 
             if plan:
                 self.current_action_plan = plan
@@ -2852,22 +3492,25 @@ Description:
                     self.plan_status_ref.current.value = "❌ Failed to generate plan"
 
         except Exception as ex:
-            import traceback
             self.logger.log(f"❌ Error generating plan: {str(ex)}")
             self.logger.log(f"❌ Traceback: {traceback.format_exc()}")
             if self.plan_status_ref.current:
                 self.plan_status_ref.current.value = f"❌ Error: {str(ex)}"
 
         finally:
-            # Re-enable Generate Plan button
-            if self.generate_plan_button_ref.current:
-                self.generate_plan_button_ref.current.disabled = False
             # Only enable Execute Plan if we have a valid plan
-            if self.execute_plan_button_ref.current and self.current_action_plan:
-                self.execute_plan_button_ref.current.disabled = False
-            if self.plan_progress_ref.current:
-                self.plan_progress_ref.current.visible = False
-            self.page.update()
+            self._finish_plan_ui(enable_execute=self.current_action_plan is not None)
+
+    def _finish_plan_ui(self, enable_execute: bool):
+        """Re-enable the plan buttons, hide the plan progress bar and push it all in one update"""
+        if self.generate_plan_button_ref.current:
+            self.generate_plan_button_ref.current.disabled = False
+        if enable_execute and self.execute_plan_button_ref.current:
+            self.execute_plan_button_ref.current.disabled = False
+        if self.plan_progress_ref.current:
+            self.plan_progress_ref.current.visible = False
+            self.plan_progress_ref.current.value = None  # Back to indeterminate
+        self.page.update()
 
     def _display_action_plan(self, plan):
         """Display the generated action plan"""
@@ -2945,12 +3588,10 @@ Description:
             self._show_snackbar("No plan to execute", error=True)
             return
 
-        # Run in thread
-        import threading
-        thread = threading.Thread(target=self._execute_plan_async)
-        thread.start()
+        # Run on the page's event loop; only the plan execution goes to a worker thread
+        self.page.run_task(self._execute_plan_async)
 
-    def _execute_plan_async(self):
+    async def _execute_plan_async(self):
         """Execute plan asynchronously"""
         try:
             self.logger.log("🔧 Starting _execute_plan_async...")
@@ -2963,6 +3604,9 @@ Description:
             if self.plan_status_ref.current:
                 self.plan_status_ref.current.value = "▶️ Executing plan..."
             if self.plan_progress_ref.current:
+                # Step counts are known, so show a determinate bar rather
+                # than one that animates until it is hidden
+                self.plan_progress_ref.current.value = 0
                 self.plan_progress_ref.current.visible = True
             self.page.update()
 
@@ -2980,7 +3624,6 @@ Description:
                 return
 
             # Create action planner
-            from .ai_action_planner import AIActionPlanner
             planner = AIActionPlanner(self.ai_manager, self.logger, self.config_manager)
             self.logger.log(f"🔧 Created AIActionPlanner, about to execute plan with {len(self.current_action_plan.steps)} steps")
 
@@ -2988,6 +3631,8 @@ Description:
             def progress_callback(current, total, message):
                 if self.plan_status_ref.current:
                     self.plan_status_ref.current.value = f"▶️ {message} ({current}/{total})"
+                if self.plan_progress_ref.current and total:
+                    self.plan_progress_ref.current.value = current / total
                 # Update the plan display in real-time to show progress
                 if self.current_action_plan:
                     self._display_action_plan(self.current_action_plan)
@@ -3003,7 +3648,8 @@ Description:
                         self.plan_status_ref.current.value = message
                     self.page.update()
 
-            result = planner.execute_plan(
+            result = await asyncio.to_thread(
+                planner.execute_plan,
                 self.current_action_plan,
                 local_repo_path,
                 progress_callback,
@@ -3023,7 +3669,6 @@ Description:
                     self.plan_status_ref.current.value = f"⚠️ Plan completed with errors: {result['failed']}/{result['total']} steps failed"
 
         except Exception as ex:
-            import traceback
             self.logger.log(f"❌ Error executing plan: {str(ex)}")
             self.logger.log(f"❌ Traceback: {traceback.format_exc()}")
             if self.plan_status_ref.current:
@@ -3031,13 +3676,7 @@ Description:
 
         finally:
             # Re-enable both buttons after execution
-            if self.execute_plan_button_ref.current:
-                self.execute_plan_button_ref.current.disabled = False
-            if self.generate_plan_button_ref.current:
-                self.generate_plan_button_ref.current.disabled = False
-            if self.plan_progress_ref.current:
-                self.plan_progress_ref.current.visible = False
-            self.page.update()
+            self._finish_plan_ui(enable_execute=True)
 
     def _show_completion_dialog(self, result):
         """Show dialog after plan execution with options to push/create PR"""
@@ -3108,16 +3747,42 @@ Description:
 class Logger:
     """Logger class for Flet"""
 
-    def __init__(self, text_field: ft.TextField):
+    # Lines logged within this window are appended to the field together
+    FLUSH_INTERVAL_SECONDS = 0.1
+
+    def __init__(self, text_field: ft.Text):
         self.text_field = text_field
+        self._queue = deque()
+        self._scheduled = False
+        self._lock = threading.Lock()
 
     def log(self, message: str):
         """Log a message"""
-        import datetime
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_message = f"[{timestamp}] {message}\n"
 
         if self.text_field:
-            current = self.text_field.value or ""
-            self.text_field.value = current + log_message
+            with self._lock:
+                self._queue.append(log_message)
+                if self._scheduled:
+                    return
+                self._scheduled = True
+            if self.text_field.page:
+                self.text_field.page.run_task(self._flush_later)
+            else:
+                self.flush()
+
+    async def _flush_later(self):
+        """Flush queued lines once the batching window has passed"""
+        await asyncio.sleep(self.FLUSH_INTERVAL_SECONDS)
+        self.flush()
+
+    def flush(self):
+        """Append all queued lines to the text field in one go"""
+        with self._lock:
+            pending = "".join(self._queue)
+            self._queue.clear()
+            self._scheduled = False
+        if pending:
+            self.text_field.value = (self.text_field.value or "") + pending
             # Auto-scroll is handled by Flet
@@ -16,7 +16,7 @@ class ProcessingLogDialog:
         self.page = page
         self.log_text_ref = log_text_ref
         self.dialog_ref = ft.Ref[ft.AlertDialog]()
-        self.log_display_ref = ft.Ref[ft.TextField]()
+        self.log_display_ref = ft.Ref[ft.Text]()
 
     def show(self):
         """Show the processing log dialog"""
@@ -48,17 +48,14 @@ class ProcessingLogDialog:
 
     def _create_dialog(self) -> ft.AlertDialog:
         """Create the processing log dialog"""
-        # Create a display field that will show a copy of the log
-        # This is synced from the main log field
-        log_display = ft.TextField(
+        # Create a display that will show a copy of the log
+        # This is synced from the main log field; selectable Text rather than
+        # a read-only TextField so no editing state is kept for it
+        log_display = ft.Text(
             ref=self.log_display_ref,
             value=self.log_text_ref.current.value if self.log_text_ref.current else "",
-            multiline=True,
-            read_only=True,
-            expand=True,
-            text_style=ft.TextStyle(font_family="Courier New"),
-            min_lines=20,
-            max_lines=30,
+            selectable=True,
+            font_family="Courier New",
         )
 
         # Refresh button
@@ -92,7 +89,7 @@ class ProcessingLogDialog:
                 alignment=ft.MainAxisAlignment.START,
             ),
             content=ft.Container(
-                content=log_display,
+                content=ft.Column([log_display], scroll=ft.ScrollMode.AUTO, expand=True),
                 width=800,
                 height=500,
             ),
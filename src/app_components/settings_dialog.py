@@ -12,6 +12,9 @@ import os
 import asyncio
 import sys
 import subprocess
+from pathlib import Path
+
+from .ai_manager import AIManager, LocalGitManager
 
 
 class SettingsDialog:
@@ -32,6 +35,8 @@ class SettingsDialog:
 
         # Package checker refs
         self.package_status_ref = ft.Ref[ft.Container]()
+        # Provider whose packages were last checked from the dropdown
+        self._checked_provider = self.config.get('AI_PROVIDER', 'none')
 
     def show(self, on_result=None):
         """Show the settings dialog"""
@@ -66,6 +71,26 @@ class SettingsDialog:
             print(f"Error in SettingsDialog.show(): {ex}")
             import traceback
             traceback.print_exc()
+            # Report the dialog as cancelled, so show_async does not wait forever
+            if on_result:
+                on_result(None)
+
+    async def show_async(self) -> Optional[Dict[str, Any]]:
+        """
+        Show the settings dialog and wait until it is closed
+
+        Returns:
+            The saved config values, or None if the dialog was cancelled
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(result):
+            # Button handlers may run off the event loop thread
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(result))
+
+        self.show(on_result=resolve)
+        return await future
 
     async def _init_async(self):
         """Initialize async operations"""
@@ -285,7 +310,7 @@ class SettingsDialog:
                 ft.dropdown.Option("ollama", "Ollama"),
             ],
             expand=True,
-            on_change=lambda e: self.page.run_task(self._check_packages_for_current_provider),
+            on_change=self._on_ai_provider_changed,
         )
         self.entries['AI_PROVIDER'] = ai_provider
         controls.append(ai_provider)
@@ -420,7 +445,6 @@ class SettingsDialog:
     def _check_ai_packages(self, provider_name: str) -> Tuple[bool, List[str]]:
         """Check if required packages for AI provider are installed"""
         try:
-            from .ai_manager import AIManager
             ai_manager = AIManager()
             available, missing = ai_manager.check_ai_module_availability(provider_name)
             return available, missing
@@ -482,6 +506,13 @@ class SettingsDialog:
         except Exception as e:
             print(f"Error loading cached Ollama models: {e}")
 
+    def _on_ai_provider_changed(self, e):
+        """Re-check packages only when a different provider is picked"""
+        if e.control.value == self._checked_provider:
+            return
+        self._checked_provider = e.control.value
+        self.page.run_task(self._check_packages_for_current_provider)
+
     async def _check_packages_for_current_provider(self):
         """Check packages for the currently selected AI provider"""
         if not self.package_status_ref.current:
@@ -759,8 +790,6 @@ class SettingsDialog:
     async def _scan_repos_async(self):
         """Scan for git repositories in the local repo path"""
         try:
-            from pathlib import Path
-
             # Get the local repo path
             local_path_field = self.entries.get('LOCAL_REPO_PATH')
             if local_path_field:
@@ -769,7 +798,7 @@ class SettingsDialog:
                 path_str = self.config.get('LOCAL_REPO_PATH', '').strip()
 
             if not path_str:
-                path_str = str(Path.home() / "Downloads" / "github_repos")
+                path_str = str(LocalGitManager.DEFAULT_REPO_BASE)
 
             print(f"🔍 Scanning for repos in: {path_str}")
             base_path = Path(path_str)
@@ -957,7 +986,6 @@ class SettingsDialog:
         ai_provider = config_values.get('AI_PROVIDER', 'none').lower()
         if ai_provider and ai_provider != 'none':
             try:
-                from .ai_manager import AIManager
                 ai_manager = AIManager()
                 available, missing = ai_manager.check_ai_module_availability(ai_provider)
 
@@ -4,25 +4,42 @@ Utility functions and helpers
 
 import json
 import os
+import queue
 import re
 import subprocess
 import threading
 import datetime
+import html
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 from urllib.parse import urlparse
 
+# Candidate ms.author values in a lower-cased doc URL, tried in order
+_MS_AUTHOR_RES = (
+    re.compile(r'/([a-z][a-z0-9-]+[a-z0-9])/'),  # username-like patterns
+    re.compile(r'author[=:]([a-z][a-z0-9-]+)'),  # author= or author: patterns
+)
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class Logger:
     """Simple logger for GUI applications"""
+
+    # Lines logged within this many milliseconds are inserted together
+    FLUSH_INTERVAL_MS = 100
     
     def __init__(self, text_widget=None):
         self.text_widget = text_widget
         self._lock = threading.Lock()
+        self._pending = queue.SimpleQueue()
+        self._drain_scheduled = False
     
     def log(self, message: str) -> None:
-        """Log a message to the text widget and console"""
-        timestamp = __import__('datetime').datetime.now().strftime("%H:%M:%S")
+        """Log a message to the console, and queue it for the text widget"""
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}"
         
         try:
@@ -33,22 +50,40 @@ class Logger:
             print(safe_message)
         
         if self.text_widget:
-            def update_widget():
-                try:
-                    with self._lock:
-                        self.text_widget.config(state='normal')
-                        self.text_widget.insert('end', formatted_message + '\n')
-                        self.text_widget.see('end')
-                        self.text_widget.config(state='disabled')
-                        self.text_widget.update_idletasks()
-                except:
-                    pass  # Widget might be destroyed
-            
-            # Schedule update on main thread
+            self._pending.put(formatted_message)
+
+            # Schedule one drain on the main thread per batching window
             if hasattr(self.text_widget, 'after'):
-                self.text_widget.after(0, update_widget)
+                with self._lock:
+                    if self._drain_scheduled:
+                        return
+                    self._drain_scheduled = True
+                self.text_widget.after(self.FLUSH_INTERVAL_MS, self._drain)
             else:
-                update_widget()
+                self._drain()
+
+    def _drain(self):
+        """Insert every queued line into the text widget with a single insert"""
+        with self._lock:
+            self._drain_scheduled = False
+
+        lines = []
+        while True:
+            try:
+                lines.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        if not lines:
+            return
+
+        try:
+            self.text_widget.config(state='normal')
+            self.text_widget.insert('end', '\n'.join(lines) + '\n')
+            self.text_widget.see('end')
+            self.text_widget.config(state='disabled')
+            self.text_widget.update_idletasks()
+        except:
+            pass  # Widget might be destroyed
 
 
 class PRNumberManager:
@@ -116,25 +151,23 @@ class GitHubInfoExtractor:
     @staticmethod
     def extract_github_info(doc_url: str) -> Dict[str, Any]:
         """Extract GitHub repository information from a document URL"""
+        # Items often share a doc URL, so the parse is cached; callers get their own copy
+        return dict(GitHubInfoExtractor._extract_github_info_cached(doc_url))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _extract_github_info_cached(doc_url: str) -> Dict[str, Any]:
+        """Uncached body of extract_github_info; the returned dict must not be modified"""
         try:
             if not doc_url or 'github.com' not in doc_url:
                 return {'error': 'Not a GitHub URL'}
             
-            parsed = urlparse(doc_url)
-            path_parts = parsed.path.strip('/').split('/')
-            
-            if len(path_parts) < 2:
+            parts = GitHubInfoExtractor._parse_github_url(doc_url)
+            if parts is None:
                 return {'error': 'Invalid GitHub URL format'}
             
-            owner = path_parts[0]
-            repo = path_parts[1]
-            
-            # Try to extract file path if it's a blob URL
-            file_path = None
-            if len(path_parts) > 3 and path_parts[2] == 'blob':
-                # Skip branch name and get file path
-                if len(path_parts) > 4:
-                    file_path = '/'.join(path_parts[4:])
+            # file_path is only set for blob URLs
+            owner, repo, _, file_path = parts
             
             result = {
                 'owner': owner,
@@ -155,6 +188,26 @@ class GitHubInfoExtractor:
         except Exception as e:
             return {'error': f'Error parsing GitHub URL: {str(e)}'}
     
+    @staticmethod
+    def _parse_github_url(url: str) -> Optional[Tuple[str, str, str, str]]:
+        """
+        Split a github.com URL into (owner, repo, ref, path) in one pass
+
+        ref and path are '' unless it is a .../blob/<ref>/<path> URL.
+        Returns None when the URL has no owner/repo part.
+        """
+        rest = url.partition('github.com/')[2].partition('?')[0].partition('#')[0]
+        owner, _, rest = rest.partition('/')
+        repo, _, rest = rest.partition('/')
+        if not owner or not repo:
+            return None
+
+        kind, _, rest = rest.partition('/')
+        if kind != 'blob':
+            return owner, repo, '', ''
+        ref, _, path = rest.partition('/')
+        return owner, repo, ref, path.strip('/')
+
     @staticmethod
     def _extract_ms_author(owner: str, repo: str, url: str) -> Optional[str]:
         """Try to extract ms.author from various sources"""
@@ -172,13 +225,8 @@ class GitHubInfoExtractor:
             url_lower = url.lower()
             
             # Common patterns for ms.author
-            patterns = [
-                r'/([a-z][a-z0-9-]+[a-z0-9])/',  # username-like patterns
-                r'author[=:]([a-z][a-z0-9-]+)',   # author= or author: patterns
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, url_lower)
+            for pattern in _MS_AUTHOR_RES:
+                match = pattern.search(url_lower)
                 if match:
                     candidate = match.group(1)
                     # Validate it looks like a reasonable username
@@ -276,30 +324,33 @@ class WorkItemFieldExtractor:
     @staticmethod
     def _clean_html(html_text: str) -> str:
         """Remove HTML tags and decode entities"""
-        import html
-        
         # Remove HTML tags
-        clean_text = re.sub(r'<[^>]+>', '', html_text)
+        clean_text = _HTML_TAG_RE.sub('', html_text)
         
         # Decode HTML entities
         clean_text = html.unescape(clean_text)
         
         # Clean up whitespace
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+        clean_text = _WHITESPACE_RE.sub(' ', clean_text).strip()
         
         return clean_text
 
 
+def _build_item_title(item: Dict[str, Any]) -> str:
+    """Issue/PR title for an item: "[#<id>] <title>", or just the title without an id"""
+    item_id = item.get('id', '')
+    if item_id:
+        return f"[#{item_id}] {item['title']}"
+    return f"{item['title']}"
+
+
 class ContentBuilders:
     """Builds content for GitHub issues and PRs"""
     
     @staticmethod
     def build_issue_title(item: Dict[str, Any]) -> str:
         """Build GitHub issue title"""
-        item_id = item.get('id', '')
-        if item_id:
-            return f"[#{item_id}] {item['title']}"
-        return f"{item['title']}"
+        return _build_item_title(item)
 
     @staticmethod
     def build_issue_body(item: Dict[str, Any], github_info: Dict[str, Any]) -> str:
@@ -380,10 +431,7 @@ class ContentBuilders:
     @staticmethod
     def build_pr_title(item: Dict[str, Any]) -> str:
         """Build GitHub PR title"""
-        item_id = item.get('id', '')
-        if item_id:
-            return f"[#{item_id}] {item['title']}"
-        return f"{item['title']}"
+        return _build_item_title(item)
     
     @staticmethod
     def build_pr_body(item: Dict[str, Any], github_info: Dict[str, Any]) -> str:
@@ -461,23 +509,31 @@ class LocalRepositoryScanner:
     @staticmethod
     def scan_local_repos(local_repo_path: str) -> List[str]:
         """Scan local path for Git repositories"""
-        if not local_repo_path or not os.path.exists(local_repo_path):
+        if not local_repo_path:
             return []
         
         repos = []
         try:
-            for item in os.listdir(local_repo_path):
-                item_path = os.path.join(local_repo_path, item)
-                if os.path.isdir(item_path):
-                    git_path = os.path.join(item_path, '.git')
-                    if os.path.exists(git_path):
-                        # Get remote origin URL to determine repo name
-                        repo_info = LocalRepositoryScanner.get_repo_info(item_path)
-                        if repo_info:
-                            repos.append(repo_info)
-                        else:
-                            # Fallback to folder name
-                            repos.append(f"local/{item}")
+            # scandir gets the directory flag from the listing itself, so each
+            # entry costs one stat (of its .git) instead of three
+            with os.scandir(local_repo_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        os.stat(os.path.join(entry.path, '.git'))
+                    except OSError:
+                        continue  # Not a Git repository
+
+                    # Get remote origin URL to determine repo name
+                    repo_info = LocalRepositoryScanner.get_repo_info(entry.path)
+                    if repo_info:
+                        repos.append(repo_info)
+                    else:
+                        # Fallback to folder name
+                        repos.append(f"local/{entry.name}")
+        except FileNotFoundError:
+            return []
         except PermissionError:
             pass  # Skip directories we can't access
         except Exception as e:
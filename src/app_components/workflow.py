@@ -3,13 +3,44 @@ Workflow Manager
 Manages GitHub workflow items (Issues and Pull Requests) from target and fork repositories
 """
 
+import sys
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 
+from .github_api import GITHUB_GRAPHQL_ENDPOINT, create_session
+
+# Fields shared by issues and pull requests - only what WorkflowItem reads
+_GQL_ITEM_FIELDS = """
+__typename number title url body state createdAt updatedAt
+author { login url }
+labels(first: 20) { nodes { name } }
+assignees(first: 10) { nodes { login } }
+comments { totalCount }
+"""
+
+_GQL_PR_FIELDS = _GQL_ITEM_FIELDS + "isDraft merged baseRefName headRefName\n"
+
+# GraphQL alias prefix -> repo_source
+_GQL_REPO_ALIASES = {'target': 't', 'fork': 'f'}
+
+
+def _intern(value):
+    """Intern strings that repeat across many items (state, author, label names)"""
+    return sys.intern(value) if type(value) is str else value
+
 
 class WorkflowItem:
     """Represents a GitHub workflow item (Issue or PR)"""
 
+    # Fixed attribute set: slot descriptors instead of a per-instance __dict__
+    __slots__ = (
+        'item_type', 'repo_source', 'data', 'number', 'title', 'state',
+        'created_at', 'updated_at', 'body', 'url', 'api_url', 'author',
+        'author_url', 'labels', 'assignees', 'is_draft', 'mergeable_state',
+        'merged', 'base_ref', 'head_ref', 'comments_count',
+    )
+
     def __init__(self, item_type: str, data: Dict[str, Any], repo_source: str):
         """
         Initialize a workflow item
@@ -26,7 +57,7 @@ class WorkflowItem:
         # Extract common fields
         self.number = data.get('number')
         self.title = data.get('title', 'No Title')
-        self.state = data.get('state', 'unknown')
+        self.state = _intern(data.get('state', 'unknown'))
         self.created_at = data.get('created_at', '')
         self.updated_at = data.get('updated_at', '')
         self.body = data.get('body', '')
@@ -35,11 +66,11 @@ class WorkflowItem:
 
         # Author information
         user = data.get('user', {})
-        self.author = user.get('login', 'unknown') if user else 'unknown'
+        self.author = _intern(user.get('login', 'unknown')) if user else 'unknown'
         self.author_url = user.get('html_url', '') if user else ''
 
         # Labels
-        self.labels = [label.get('name', '') for label in data.get('labels', [])]
+        self.labels = [_intern(label.get('name', '')) for label in data.get('labels', [])]
 
         # Assignees
         assignees = data.get('assignees', [])
@@ -102,16 +133,22 @@ class WorkflowItem:
         return cls(item_type, raw_data, repo_source)
 
 
+def format_item_label(item: WorkflowItem) -> str:
+    """Display label for an item, e.g. '#42: Fix typo'"""
+    return f"#{item.number}: {item.title}"
+
+
 class GitHubRepoFetcher:
     """Fetches repository information from GitHub"""
 
-    def __init__(self, github_token: str, logger=None):
+    def __init__(self, github_token: str, logger=None, session: Optional[requests.Session] = None):
         """
         Initialize the repo fetcher
 
         Args:
             github_token: GitHub Personal Access Token
             logger: Optional logger instance
+            session: HTTP session to share; a new one is created if omitted
         """
         self.token = github_token
         self.logger = logger
@@ -120,6 +157,7 @@ class GitHubRepoFetcher:
             "Accept": "application/vnd.github+json",
             "User-Agent": "github-automation-tool/1.0"
         }
+        self._session = session or create_session()
 
     def log(self, message: str):
         """Log a message"""
@@ -137,7 +175,7 @@ class GitHubRepoFetcher:
         """
         try:
             url = "https://api.github.com/user"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self._session.get(url, headers=self.headers, timeout=30)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -164,7 +202,7 @@ class GitHubRepoFetcher:
                 'direction': 'desc'
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self._session.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
 
             repos = response.json()
@@ -240,7 +278,7 @@ class GitHubRepoFetcher:
                 'order': 'desc'
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self._session.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -254,7 +292,8 @@ class GitHubRepoFetcher:
             self.log(f"❌ Error searching repositories: {str(e)}")
             return []
 
-    def get_repo_names(self, repos: List[Dict[str, Any]]) -> List[str]:
+    @staticmethod
+    def get_repo_names(repos: List[Dict[str, Any]]) -> List[str]:
         """
         Extract repository names in 'owner/repo' format
 
@@ -285,8 +324,9 @@ class WorkflowManager:
             "Accept": "application/vnd.github+json",
             "User-Agent": "github-automation-tool/1.0"
         }
-        # Initialize repo fetcher
-        self.repo_fetcher = GitHubRepoFetcher(github_token, logger)
+        self._session = create_session()
+        # Repo fetcher is only built if something asks for it
+        self._repo_fetcher = None
 
     def log(self, message: str):
         """Log a message"""
@@ -295,7 +335,15 @@ class WorkflowManager:
         else:
             print(message)
 
-    def _parse_repo(self, repo_str: str) -> Optional[Tuple[str, str]]:
+    @property
+    def repo_fetcher(self) -> GitHubRepoFetcher:
+        """Repository fetcher sharing this manager's token, created on first use"""
+        if self._repo_fetcher is None:
+            self._repo_fetcher = GitHubRepoFetcher(self.token, self.logger, self._session)
+        return self._repo_fetcher
+
+    @staticmethod
+    def _parse_repo(repo_str: str) -> Optional[Tuple[str, str]]:
         """
         Parse a repository string into owner and name
 
@@ -345,15 +393,13 @@ class WorkflowManager:
                 'direction': 'desc'
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self._session.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
 
-            items_data = response.json()
-
             # Filter out pull requests (GitHub's issues endpoint includes PRs)
-            issues_data = [item for item in items_data if 'pull_request' not in item]
-
-            issues = [WorkflowItem('issue', data, repo_source) for data in issues_data]
+            # while wrapping, so no intermediate list of raw issues is kept
+            issues = [WorkflowItem('issue', data, repo_source)
+                      for data in response.json() if 'pull_request' not in data]
 
             self.log(f" Found {len(issues)} issues in {owner}/{repo}")
             return issues
@@ -400,11 +446,10 @@ class WorkflowManager:
                 'direction': 'desc'
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self._session.get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
 
-            prs_data = response.json()
-            prs = [WorkflowItem('pull_request', data, repo_source) for data in prs_data]
+            prs = [WorkflowItem('pull_request', data, repo_source) for data in response.json()]
 
             self.log(f" Found {len(prs)} pull requests in {owner}/{repo}")
             return prs
@@ -437,26 +482,17 @@ class WorkflowManager:
         Returns:
             Dictionary with keys 'target_issues', 'target_prs', 'fork_issues', 'fork_prs'
         """
-        results = {
-            'target_issues': [],
-            'target_prs': [],
-            'fork_issues': [],
-            'fork_prs': []
-        }
-
-        # Fetch from target repository
+        repos = {}
         if target_repo:
-            if include_issues:
-                results['target_issues'] = self.fetch_issues(target_repo, 'target', state)
-            if include_prs:
-                results['target_prs'] = self.fetch_pull_requests(target_repo, 'target', state)
-
-        # Fetch from fork repository
+            repos['target'] = target_repo
         if fork_repo:
-            if include_issues:
-                results['fork_issues'] = self.fetch_issues(fork_repo, 'fork', state)
-            if include_prs:
-                results['fork_prs'] = self.fetch_pull_requests(fork_repo, 'fork', state)
+            repos['fork'] = fork_repo
+
+        # One GraphQL roundtrip for both repos; fall back to REST on failure
+        results = self._gql_fetch_workflow_items(repos, include_issues, include_prs, state)
+        if results is None:
+            results = self._rest_fetch_workflow_items(target_repo, fork_repo,
+                                                      include_issues, include_prs, state)
 
         # Log summary
         total = sum(len(items) for items in results.values())
@@ -469,6 +505,168 @@ class WorkflowManager:
 
         return results
 
+    def _rest_fetch_workflow_items(self, target_repo: str, fork_repo: str,
+                                   include_issues: bool, include_prs: bool,
+                                   state: str) -> Dict[str, List[WorkflowItem]]:
+        """Fetch workflow items with one REST call per repo and item type, run concurrently"""
+        results = {
+            'target_issues': [],
+            'target_prs': [],
+            'fork_issues': [],
+            'fork_prs': []
+        }
+
+        # The (at most four) calls are independent, so overlap their latency
+        with ThreadPoolExecutor(max_workers=len(results)) as executor:
+            futures = {}
+
+            # Fetch from target repository
+            if target_repo:
+                if include_issues:
+                    futures['target_issues'] = executor.submit(self.fetch_issues, target_repo, 'target', state)
+                if include_prs:
+                    futures['target_prs'] = executor.submit(self.fetch_pull_requests, target_repo, 'target', state)
+
+            # Fetch from fork repository
+            if fork_repo:
+                if include_issues:
+                    futures['fork_issues'] = executor.submit(self.fetch_issues, fork_repo, 'fork', state)
+                if include_prs:
+                    futures['fork_prs'] = executor.submit(self.fetch_pull_requests, fork_repo, 'fork', state)
+
+            # fetch_* catch their own errors and return [] on failure
+            for key, future in futures.items():
+                results[key] = future.result()
+
+        return results
+
+    def _gql_fetch_workflow_items(self, repos: Dict[str, str],
+                                  include_issues: bool = True,
+                                  include_prs: bool = True,
+                                  state: str = 'all') -> Optional[Dict[str, List[WorkflowItem]]]:
+        """
+        Fetch issues and pull requests for several repositories in a single GraphQL query
+
+        Each repository becomes an aliased ``repository`` block ('t' for target, 'f' for fork),
+        and ``@include`` skips the connections that were not requested.
+
+        Args:
+            repos: Mapping of repo_source ('target'/'fork') to "owner/repo"
+            include_issues: Whether to fetch issues
+            include_prs: Whether to fetch pull requests
+            state: 'open', 'closed', or 'all'
+
+        Returns:
+            Dictionary with keys 'target_issues', 'target_prs', 'fork_issues', 'fork_prs',
+            or None if the query failed (caller should fall back to REST)
+        """
+        results = {
+            'target_issues': [],
+            'target_prs': [],
+            'fork_issues': [],
+            'fork_prs': []
+        }
+
+        var_defs = ["$withIssues: Boolean!", "$withPrs: Boolean!",
+                    "$issueStates: [IssueState!]", "$prStates: [PullRequestState!]"]
+        variables = {
+            'withIssues': include_issues,
+            'withPrs': include_prs,
+            'issueStates': None if state == 'all' else [state.upper()],
+            'prStates': None if state == 'all' else (['OPEN'] if state == 'open' else ['CLOSED', 'MERGED']),
+        }
+        blocks = []
+        parsed_repos = {}
+
+        for repo_source, repo_str in repos.items():
+            parsed = self._parse_repo(repo_str)
+            if not parsed:
+                self.log(f"L Invalid repository format: {repo_str}")
+                continue
+            parsed_repos[repo_source] = parsed
+            alias = _GQL_REPO_ALIASES[repo_source]
+            var_defs += [f"${alias}Owner: String!", f"${alias}Name: String!"]
+            variables[f"{alias}Owner"], variables[f"{alias}Name"] = parsed
+            blocks.append(f"""
+  {alias}: repository(owner: ${alias}Owner, name: ${alias}Name) {{
+    pullRequests(first: 100, states: $prStates, orderBy: {{field: UPDATED_AT, direction: DESC}}) @include(if: $withPrs) {{
+      nodes {{ {_GQL_PR_FIELDS} }}
+    }}
+    issues(first: 100, states: $issueStates, orderBy: {{field: UPDATED_AT, direction: DESC}}) @include(if: $withIssues) {{
+      nodes {{ {_GQL_ITEM_FIELDS} }}
+    }}
+  }}""")
+
+        if not blocks:
+            return results
+
+        query = f"query({', '.join(var_defs)}) {{{''.join(blocks)}\n}}"
+        self.log(f"Fetching workflow items via GraphQL for {', '.join(repos.values())}...")
+
+        try:
+            response = self._session.post(GITHUB_GRAPHQL_ENDPOINT, headers=self.headers,
+                                     json={'query': query, 'variables': variables}, timeout=60)
+            response.raise_for_status()
+            payload = response.json()
+        except Exception as e:
+            self.log(f"L GraphQL fetch failed, falling back to REST: {str(e)}")
+            return None
+
+        if payload.get('errors'):
+            self.log(f"L GraphQL errors, falling back to REST: {payload['errors']}")
+            return None
+
+        data = payload.get('data') or {}
+        for repo_source, (owner, repo) in parsed_repos.items():
+            repo_data = data.get(_GQL_REPO_ALIASES[repo_source]) or {}
+            pr_nodes = (repo_data.get('pullRequests') or {}).get('nodes') or []
+            issue_nodes = (repo_data.get('issues') or {}).get('nodes') or []
+
+            results[f'{repo_source}_prs'] = [
+                WorkflowItem('pull_request', self._gql_node_to_rest(node, owner, repo), repo_source)
+                for node in pr_nodes if node
+            ]
+            results[f'{repo_source}_issues'] = [
+                WorkflowItem('issue', self._gql_node_to_rest(node, owner, repo), repo_source)
+                for node in issue_nodes if node
+            ]
+            self.log(f" Found {len(results[f'{repo_source}_prs'])} pull requests and "
+                     f"{len(results[f'{repo_source}_issues'])} issues in {owner}/{repo}")
+
+        return results
+
+    @staticmethod
+    def _gql_node_to_rest(node: Dict[str, Any], owner: str, repo: str) -> Dict[str, Any]:
+        """Convert a GraphQL issue/PR node into the REST-shaped dict WorkflowItem expects"""
+        is_pr = node.get('__typename') == 'PullRequest'
+        author = node.get('author')
+        state = (node.get('state') or 'unknown').lower()
+        kind = 'pulls' if is_pr else 'issues'
+
+        data = {
+            'number': node.get('number'),
+            'title': node.get('title', 'No Title'),
+            # REST reports merged PRs as 'closed'
+            'state': 'closed' if state == 'merged' else state,
+            'created_at': node.get('createdAt', ''),
+            'updated_at': node.get('updatedAt', ''),
+            'body': node.get('body', ''),
+            'html_url': node.get('url', ''),
+            'url': f"https://api.github.com/repos/{owner}/{repo}/{kind}/{node.get('number')}",
+            'user': {'login': author.get('login', 'unknown'), 'html_url': author.get('url', '')} if author else None,
+            'labels': [{'name': n.get('name', '')} for n in (node.get('labels') or {}).get('nodes') or [] if n],
+            'assignees': [{'login': n.get('login', '')} for n in (node.get('assignees') or {}).get('nodes') or [] if n],
+            'comments': (node.get('comments') or {}).get('totalCount', 0),
+        }
+
+        if is_pr:
+            data['draft'] = node.get('isDraft', False)
+            data['merged'] = node.get('merged', False)
+            data['base'] = {'ref': node.get('baseRefName', '')}
+            data['head'] = {'ref': node.get('headRefName', '')}
+
+        return data
+
     def get_combined_items(self, workflow_items: Dict[str, List[WorkflowItem]],
                           sort_by: str = 'updated') -> List[WorkflowItem]:
         """
@@ -553,7 +751,9 @@ class WorkflowManager:
             url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments"
             print(f"DEBUG: Fetching comments from URL: {url}", flush=True)
 
-            response = requests.get(url, headers=self.headers)
+            # GitHub's largest page size: most threads arrive in one request
+            response = self._session.get(url, headers=self.headers,
+                                         params={'per_page': 100}, timeout=30)
             print(f"DEBUG: Response status code: {response.status_code}", flush=True)
             print(f"DEBUG: Response headers: {dict(response.headers)}", flush=True)
             print(f"DEBUG: Response text length: {len(response.text)}", flush=True)
@@ -618,7 +818,8 @@ class WorkflowManager:
             url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/files"
             print(f"DEBUG: Fetching PR files from URL: {url}", flush=True)
 
-            response = requests.get(url, headers=self.headers)
+            response = self._session.get(url, headers=self.headers,
+                                         params={'per_page': 100}, timeout=30)
             response.raise_for_status()
 
             files_data = response.json()
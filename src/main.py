@@ -34,6 +34,25 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Config strings that enable a boolean setting such as DRY_RUN
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _to_bool(value) -> bool:
+    """Interpret a boolean setting given as a bool or as a config string"""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in _TRUTHY
+
+# Material Design 3 theme, built once and shared by every page session
+_APP_THEME = ft.Theme(
+    color_scheme_seed="blue",
+    use_material3=True,
+)
+
+_THEME_MODES = {'dark': ft.ThemeMode.DARK, 'light': ft.ThemeMode.LIGHT}
+
+
 class GitHubAutomationApp:
     """Main application class that orchestrates all components"""
 
@@ -58,10 +77,7 @@ class GitHubAutomationApp:
             self.page.window_min_height = 800
 
         # Material Design 3 theme with optimized settings
-        self.page.theme = ft.Theme(
-            color_scheme_seed="blue",
-            use_material3=True,
-        )
+        self.page.theme = _APP_THEME
 
         # Initialize core managers
         self.config_manager = ConfigManager()
@@ -72,7 +88,7 @@ class GitHubAutomationApp:
 
         # Initialize dry run state
         dry_run_config = self.config.get('DRY_RUN', 'false')
-        self.dry_run_enabled = str(dry_run_config).lower() in ('true', '1', 'yes', 'on')
+        self.dry_run_enabled = _to_bool(dry_run_config)
 
         # Register listener for live settings updates
         self.config_manager.register_listener(self._on_setting_changed)
@@ -88,6 +104,9 @@ class GitHubAutomationApp:
         # Build UI
         self.page.add(self.main_gui.build())
 
+        # Write out repo selections still waiting on their debounced save
+        self.page.on_disconnect = lambda e: self.main_gui.flush_pending_config()
+
         # Check AI provider setup after a short delay
         self.page.run_task(self._check_ai_provider_setup_async)
 
@@ -98,9 +117,9 @@ class GitHubAutomationApp:
             import asyncio
             await asyncio.sleep(0.5)
 
-            ai_provider = self.config.get('AI_PROVIDER', '').strip().lower()
+            ai_provider = self.config_manager.get_settings().ai_provider
 
-            if not ai_provider or ai_provider in ['none', '']:
+            if ai_provider == 'none':
                 return  # No AI provider selected
 
             if ai_provider not in ['chatgpt', 'claude', 'anthropic', 'github-copilot', 'copilot', 'github_copilot']:
@@ -128,7 +147,7 @@ class GitHubAutomationApp:
             self.config = self.config_manager.get_config()
             # Update dry run state
             dry_run_config = self.config.get('DRY_RUN', 'false')
-            self.dry_run_enabled = str(dry_run_config).lower() in ('true', '1', 'yes', 'on')
+            self.dry_run_enabled = _to_bool(dry_run_config)
         return success
 
     def create_github_api(self, token=None, dry_run=None):
@@ -153,16 +172,16 @@ class GitHubAutomationApp:
 
         # Theme changes - apply immediately
         if key == 'THEME_MODE':
-            if value == 'dark':
-                self.page.theme_mode = ft.ThemeMode.DARK
-            elif value == 'light':
-                self.page.theme_mode = ft.ThemeMode.LIGHT
-            self.page.update()
-            print(f"✓ Theme updated to {value}")
+            theme_mode = _THEME_MODES.get(value)
+            # Re-applying the current mode would repaint the page for nothing
+            if theme_mode is not None and theme_mode != self.page.theme_mode:
+                self.page.theme_mode = theme_mode
+                self.page.update()
+                print(f"✓ Theme updated to {value}")
 
         # Dry run mode changes
         elif key == 'DRY_RUN':
-            self.dry_run_enabled = str(value).lower() in ('true', '1', 'yes', 'on')
+            self.dry_run_enabled = _to_bool(value)
             print(f"✓ Dry run mode: {self.dry_run_enabled}")
 
         # GitHub token changes - reinitialize API